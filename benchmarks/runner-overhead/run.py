@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks of the fixed cost the reference runner adds around solve().
+
+Each runner stage is timed in isolation against the bundled examples,
+``templates/minimal-dmp`` and a generated no-op package. The no-op package is
+also run on generated instances of increasing size to show how instance
+loading and schema validation scale. Everything runs offline, in-process.
+
+Usage:
+  python benchmarks/runner-overhead/run.py --output overhead.json
+  python benchmarks/runner-overhead/run.py --repeat 5 --sizes-mb 1 10
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+try:
+    import rastion  # noqa: F401
+except ImportError:  # running from a source checkout without installing
+    sys.path.insert(0, str(REPO_ROOT / "core"))
+    import rastion  # noqa: F401
+
+from rastion.decision_model_package.bench import summarize_timings
+from rastion.decision_model_package.runner import (
+    call_with_supported_args,
+    collect_instance_errors,
+    import_module,
+    load_instance_validator,
+    load_json,
+    load_yaml,
+    prepare_package,
+    run_package,
+)
+from rastion.decision_model_package.schema_cache import VALIDATOR_CACHE
+from rastion.decision_model_package.validate_package import validate_package
+
+# Bump when the structure of the report changes.
+REPORT_FORMAT = "rastion-runner-overhead/1"
+# Length of each string element in generated large instances.
+PAYLOAD_ITEM_LENGTH = 64
+
+NOOP_MODEL = '''def create_model(instance, solver_config=None):
+    return None
+
+
+def solve(model, instance=None, solver_config=None):
+    return {"status": "feasible", "solution": {}, "objective": 0}
+'''
+
+NOOP_EVALUATE = '''def check_feasibility(solution, instance):
+    return []
+
+
+def evaluate(solution, instance, runtime=None):
+    return {"feasible": True, "objective": 0, "violations": []}
+'''
+
+NOOP_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "title": "Runner overhead payload",
+    "type": "object",
+    "required": ["payload"],
+    "properties": {"payload": {"type": "array", "items": {"type": "string"}}},
+    "additionalProperties": False,
+}
+
+NOOP_DECISION_CARD = """---
+name: "runner-overhead-noop"
+version: "0.1.0"
+decision_model_package_version: "0.1"
+problem_class: "benchmark"
+license: "Apache-2.0"
+authors:
+  - name: "Rastion"
+tags:
+  - "benchmark"
+---
+
+No-op package used to measure runner overhead.
+"""
+
+NOOP_SOLVER = """solver:
+  name: noop
+  backend: python
+"""
+
+
+def write_noop_package(root: Path) -> Path:
+    package_dir = root / "noop-dmp"
+    package_dir.mkdir()
+    (package_dir / "model.py").write_text(NOOP_MODEL, encoding="utf-8")
+    (package_dir / "evaluate.py").write_text(NOOP_EVALUATE, encoding="utf-8")
+    (package_dir / "instance_schema.json").write_text(json.dumps(NOOP_SCHEMA), encoding="utf-8")
+    (package_dir / "solver.yaml").write_text(NOOP_SOLVER, encoding="utf-8")
+    (package_dir / "decision_card.md").write_text(NOOP_DECISION_CARD, encoding="utf-8")
+    (package_dir / "instance.json").write_text('{"payload": []}\n', encoding="utf-8")
+    return package_dir
+
+
+def write_payload_instance(path: Path, size_bytes: int) -> int:
+    """Write a no-op instance of about ``size_bytes``; returns the actual size."""
+    item = json.dumps("x" * PAYLOAD_ITEM_LENGTH)
+    count = max(size_bytes // (len(item) + 1), 1)
+    with path.open("w", encoding="utf-8") as stream:
+        stream.write('{"payload": [')
+        stream.write(",".join([item] * count))
+        stream.write("]}\n")
+    return path.stat().st_size
+
+
+def run_errors(prepared, instance_path: Path) -> list[str]:
+    result = prepared.run_path(instance_path)
+    return list(result.get("violations") or ["run failed"]) if result.get("status") == "error" else []
+
+
+def bind_supported_args(func: Callable[..., Any], **kwargs: Any) -> Callable[[], Any]:
+    """Resolve the arguments ``func`` accepts once, outside the timed region."""
+    parameters = inspect.signature(func).parameters
+    if not any(param.kind == param.VAR_KEYWORD for param in parameters.values()):
+        kwargs = {name: value for name, value in kwargs.items() if name in parameters}
+    return lambda: func(**kwargs)
+
+
+def time_calls(func: Callable[[], Any], repeat: int, setup: Callable[[], Any] | None = None) -> dict:
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize_timings(samples)
+
+
+def discover_packages() -> list[tuple[Path, Path]]:
+    """``(package_dir, instance_path)`` for every bundled package with an instance."""
+    candidates = sorted(path.parent for path in (REPO_ROOT / "examples").glob("*/model.py"))
+    candidates += sorted(path.parent for path in (REPO_ROOT / "examples").glob("*/dmp/model.py"))
+    candidates.append(REPO_ROOT / "templates" / "minimal-dmp")
+    packages = []
+    for package_dir in candidates:
+        instance_path = package_dir / "instance.json"
+        if not instance_path.exists():
+            instances = sorted((package_dir.parent / "instances").glob("*.json"))
+            if not instances:
+                continue
+            instance_path = instances[0]
+        packages.append((package_dir, instance_path))
+    return packages
+
+
+def package_label(package_dir: Path) -> str:
+    if package_dir.is_relative_to(REPO_ROOT):
+        return package_dir.relative_to(REPO_ROOT).as_posix()
+    return package_dir.name
+
+
+def measure_package(package_dir: Path, instance_path: Path, repeat: int) -> dict:
+    report = {"package": package_label(package_dir), "instance": instance_path.name}
+    prepared = prepare_package(package_dir)
+    errors = run_errors(prepared, instance_path)
+    if errors:
+        # Timing the error path would not say anything about the overhead.
+        report["error"] = errors
+        return report
+
+    solver_config = load_yaml(package_dir / "solver.yaml")
+    schema_path = package_dir / "instance_schema.json"
+    validator = load_instance_validator(schema_path)
+    model_module = import_module(package_dir / "model.py", "dmp_model")
+    evaluate_module = import_module(package_dir / "evaluate.py", "dmp_evaluate")
+    instance = load_json(instance_path)
+
+    create_model = bind_supported_args(
+        model_module.create_model, instance=instance, solver_config=solver_config
+    )
+    model = create_model()
+    solve = bind_supported_args(
+        model_module.solve, model=model, instance=instance, solver_config=solver_config
+    )
+    solution = solve().get("solution", {})
+    evaluate = bind_supported_args(
+        evaluate_module.evaluate, solution=solution, instance=instance, runtime=0.0
+    )
+
+    def direct() -> None:
+        create_model()
+        solve()
+        evaluate()
+
+    stages = {
+        "validate_package": time_calls(lambda: validate_package(package_dir), repeat),
+        "load_solver_config": time_calls(lambda: load_yaml(package_dir / "solver.yaml"), repeat),
+        "load_instance_schema_cold": time_calls(
+            lambda: load_instance_validator(schema_path), repeat, setup=VALIDATOR_CACHE.clear
+        ),
+        "load_instance_schema_warm": time_calls(lambda: load_instance_validator(schema_path), repeat),
+        "import_modules": time_calls(
+            lambda: (
+                import_module(package_dir / "model.py", "dmp_model"),
+                import_module(package_dir / "evaluate.py", "dmp_evaluate"),
+            ),
+            repeat,
+        ),
+        "load_instance": time_calls(lambda: load_json(instance_path), repeat),
+        "validate_instance": time_calls(lambda: collect_instance_errors(validator, instance), repeat),
+        "model_solve_evaluate": time_calls(direct, repeat),
+        "prepared_run": time_calls(lambda: prepared.run_path(instance_path), repeat),
+        "run_package": time_calls(lambda: run_package(package_dir, instance_path), repeat),
+    }
+    direct_seconds = stages["model_solve_evaluate"]["median"]
+    report["stages"] = stages
+    report["overhead_seconds"] = {
+        "prepared_run": stages["prepared_run"]["median"] - direct_seconds,
+        "run_package": stages["run_package"]["median"] - direct_seconds,
+    }
+    return report
+
+
+def measure_dispatch(repeat: int, calls: int = 10_000) -> dict:
+    """Per-call cost of call_with_supported_args next to a plain call."""
+
+    def noop(model, instance, solver_config):
+        return None
+
+    kwargs = {"model": None, "instance": None, "solver_config": None, "unused": None}
+
+    def plain() -> None:
+        for _ in range(calls):
+            noop(None, None, None)
+
+    def dispatched() -> None:
+        for _ in range(calls):
+            call_with_supported_args(noop, **kwargs)
+
+    plain_stats = time_calls(plain, repeat)
+    dispatched_stats = time_calls(dispatched, repeat)
+    return {
+        "calls": calls,
+        "plain_call_seconds": plain_stats["median"] / calls,
+        "call_with_supported_args_seconds": dispatched_stats["median"] / calls,
+    }
+
+
+def measure_scaling(noop_dir: Path, scratch: Path, sizes_mb: list[float], repeat: int) -> list[dict]:
+    validator = load_instance_validator(noop_dir / "instance_schema.json")
+    prepared = prepare_package(noop_dir)
+    curve = []
+    for size_mb in sizes_mb:
+        instance_path = scratch / f"payload-{size_mb:g}mb.json"
+        size_bytes = write_payload_instance(instance_path, int(size_mb * 1024 * 1024))
+        errors = run_errors(prepared, instance_path)
+        if errors:
+            raise RuntimeError(f"no-op package failed on {instance_path.name}: {errors}")
+        instance = load_json(instance_path)
+        stages = {
+            "load_instance": time_calls(lambda: load_json(instance_path), repeat),
+            "validate_instance": time_calls(
+                lambda: collect_instance_errors(validator, instance), repeat
+            ),
+            "prepared_run": time_calls(lambda: prepared.run_path(instance_path), repeat),
+        }
+        del instance
+        instance_path.unlink()
+        curve.append(
+            {
+                "size_bytes": size_bytes,
+                "stages": stages,
+                "bytes_per_second": {
+                    name: size_bytes / stats["median"] if stats["median"] else None
+                    for name, stats in stages.items()
+                },
+            }
+        )
+    return curve
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure reference runner overhead per stage.")
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Timed calls per stage and package (default: 20)"
+    )
+    parser.add_argument(
+        "--sizes-mb",
+        type=float,
+        nargs="*",
+        default=[1, 10, 100],
+        help="Generated instance sizes for the scaling curve (default: 1 10 100)",
+    )
+    parser.add_argument(
+        "--scaling-repeat",
+        type=int,
+        default=3,
+        help="Timed calls per stage and instance size (default: 3)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="rastion-overhead-") as scratch:
+        scratch_dir = Path(scratch)
+        noop_dir = write_noop_package(scratch_dir)
+        packages = discover_packages() + [(noop_dir, noop_dir / "instance.json")]
+        report = {
+            "format": REPORT_FORMAT,
+            "environment": environment(),
+            "repeat": args.repeat,
+            "packages": [
+                measure_package(package_dir, instance_path, args.repeat)
+                for package_dir, instance_path in packages
+            ],
+            "dispatch": measure_dispatch(args.repeat),
+            "scaling": measure_scaling(noop_dir, scratch_dir, args.sizes_mb, args.scaling_repeat),
+        }
+
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,12 +3,41 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import os
+import sys
 from pathlib import Path
 from importlib.util import find_spec
 
 
+def run_via_daemon(args: argparse.Namespace) -> int:
+    from .decision_model_package.daemon import default_socket_path, request_run
+
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+    try:
+        result = request_run(socket_path, Path(args.package_dir), Path(args.instance))
+    except (ConnectionError, RuntimeError) as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    emit_result(args, result)
+    return 0 if result.get("status") != "error" else 1
+
+
+def emit_result(args: argparse.Namespace, result: dict) -> None:
+    from .decision_model_package import json_codec
+
+    payload = json_codec.dumps(result, compact=args.compact)
+    if args.output:
+        Path(args.output).write_bytes(payload + b"\n")
+    else:
+        print(payload.decode("utf-8"))
+
+
 def run_command(args: argparse.Namespace) -> int:
+    if args.via_daemon:
+        return run_via_daemon(args)
+
     missing = [name for name in ("jsonschema", "yaml") if find_spec(name) is None]
     if missing:
         print("Missing required dependencies: jsonschema, PyYAML")
@@ -17,17 +46,235 @@ def run_command(args: argparse.Namespace) -> int:
 
     from .decision_model_package.runner import run_package
 
-    result = run_package(Path(args.package_dir), Path(args.instance))
-    payload = json.dumps(result, indent=2, sort_keys=True)
+    start_memory_tracing(args)
+    result = run_package(
+        Path(args.package_dir),
+        Path(args.instance),
+        result_cache=build_result_cache(args),
+        limits=build_run_limits(args),
+        fail_fast=args.fail_fast,
+    )
+    emit_result(args, result)
 
-    if args.output:
-        Path(args.output).write_text(payload + "\n", encoding="utf-8")
-    else:
-        print(payload)
+    metrics = build_phase_metrics(args)
+    if metrics is not None:
+        metrics.add(result)
+        write_phase_metrics(args, metrics)
 
     return 0 if result.get("status") != "error" else 1
 
 
+def write_result(output_path: Path, result: dict, compact: bool = False) -> None:
+    from .decision_model_package import json_codec
+
+    output_path.write_bytes(json_codec.dumps(result, compact=compact) + b"\n")
+
+
+def parse_size(value: str) -> int:
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+    text = value.strip().upper().removesuffix("B")
+    multiplier = 1
+    if text and text[-1] in units:
+        multiplier = units[text[-1]]
+        text = text[:-1]
+    try:
+        size = int(float(text) * multiplier)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid size: {value}") from exc
+    if size < 0:
+        raise argparse.ArgumentTypeError("size must not be negative")
+    return size
+
+
+def build_result_cache(args: argparse.Namespace):
+    if not getattr(args, "cache", False):
+        return None
+
+    from .decision_model_package.result_cache import ResultCache
+
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    return ResultCache(cache_dir, max_bytes=args.cache_max_bytes)
+
+
+def positive_float(value: str) -> float:
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError("must be a positive number")
+    return number
+
+
+def build_run_limits(args: argparse.Namespace):
+    from .decision_model_package.supervisor import RunLimits
+
+    return RunLimits(timeout_seconds=args.timeout, max_memory_bytes=args.max_memory)
+
+
+def add_limit_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--timeout",
+        type=positive_float,
+        default=None,
+        help="Wall-clock limit in seconds for create_model/solve/evaluate of each instance",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=parse_size,
+        default=None,
+        help="Peak memory limit per instance, e.g. 512M or 4G",
+    )
+
+
+def add_validation_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop instance validation at the first error instead of reporting all of them",
+    )
+
+
+def add_compact_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write result JSON without indentation (NDJSON output is always compact)",
+    )
+
+
+def add_profiling_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--metrics-file",
+        help="Write per-phase runner metrics, summed over all instances, in Prometheus text format",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Record tracemalloc peak allocations per phase (slows execution down)",
+    )
+
+
+def start_memory_tracing(args: argparse.Namespace) -> None:
+    if not args.trace_memory:
+        return
+
+    import tracemalloc
+
+    # Inherited by spawned worker and supervisor processes; forked ones keep tracing.
+    os.environ["PYTHONTRACEMALLOC"] = "1"
+    tracemalloc.start()
+
+
+def build_phase_metrics(args: argparse.Namespace):
+    if not args.metrics_file:
+        return None
+
+    from .decision_model_package.instrumentation import PhaseMetrics
+
+    return PhaseMetrics()
+
+
+def record_phase_metrics(on_result, metrics):
+    if metrics is None:
+        return on_result
+
+    def recording(key, result: dict) -> None:
+        metrics.add(result)
+        on_result(key, result)
+
+    return recording
+
+
+def write_phase_metrics(args: argparse.Namespace, metrics) -> None:
+    Path(args.metrics_file).write_text(metrics.render(), encoding="utf-8")
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cache-dir",
+        help="Result cache directory (default: $RASTION_CACHE_DIR or ~/.cache/rastion/results)",
+    )
+    parser.add_argument(
+        "--cache-max-bytes",
+        type=parse_size,
+        default="1G",
+        help="Evict least recently used cache entries beyond this size (default: 1G)",
+    )
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+
+def open_ndjson_output(target: str):
+    if target == "-":
+        return contextlib.nullcontext(sys.stdout)
+    return open(target, "w", encoding="utf-8")
+
+
+def run_all_stream_command(args: argparse.Namespace, instances: str, metrics) -> int:
+    from .decision_model_package import json_codec
+    from .decision_model_package.batch import iter_ndjson_records, run_instances, run_stream
+
+    # Diagnostics go to stderr so they never mix into an NDJSON stream on stdout.
+    if args.incremental:
+        print("--incremental requires an instances directory and file output", file=sys.stderr)
+        return 1
+    if args.output_format != "ndjson" and (instances == "-" or Path(instances).is_file()):
+        print("NDJSON instance input requires --output-format ndjson", file=sys.stderr)
+        return 1
+    if args.output != "-" and Path(args.output).is_dir():
+        print(f"NDJSON output must be a file or '-', not a directory: {args.output}", file=sys.stderr)
+        return 1
+
+    with open_ndjson_output(args.output) as output_stream:
+
+        def on_result(key, result: dict) -> None:
+            name = key.name if isinstance(key, Path) else key
+            record = {"instance": name, "result": result}
+            output_stream.write(json_codec.dumps(record, compact=True).decode("utf-8") + "\n")
+            output_stream.flush()
+
+        on_result = record_phase_metrics(on_result, metrics)
+        jobs = args.jobs or default_jobs()
+        result_cache = build_result_cache(args)
+        limits = build_run_limits(args)
+        instances_path = Path(instances)
+        if instances != "-" and instances_path.is_dir():
+            from .decision_model_package.array_instance import list_instance_paths
+
+            instance_paths = list_instance_paths(instances_path)
+            if not instance_paths:
+                print(f"No instance files found in {instances_path}", file=sys.stderr)
+                return 1
+            return run_instances(
+                Path(args.package_dir),
+                instance_paths,
+                on_result,
+                jobs,
+                result_cache,
+                limits,
+                args.fail_fast,
+            )
+
+        if instances == "-":
+            records = iter_ndjson_records(sys.stdin, "<stdin>")
+            return run_stream(
+                Path(args.package_dir), records, on_result, jobs, result_cache, limits, args.fail_fast
+            )
+
+        with instances_path.open("r", encoding="utf-8") as input_stream:
+            records = iter_ndjson_records(input_stream, instances_path.name)
+            return run_stream(
+                Path(args.package_dir), records, on_result, jobs, result_cache, limits, args.fail_fast
+            )
+
+
 def run_all_command(args: argparse.Namespace) -> int:
     missing = [name for name in ("jsonschema", "yaml") if find_spec(name) is None]
     if missing:
@@ -35,30 +282,232 @@ def run_all_command(args: argparse.Namespace) -> int:
         print("Install with: pip install jsonschema PyYAML")
         return 1
 
-    from .decision_model_package.runner import run_package
+    start_memory_tracing(args)
+    metrics = build_phase_metrics(args)
+    try:
+        if args.output_format == "ndjson" or args.instances == "-" or Path(args.instances).is_file():
+            return run_all_stream_command(args, args.instances, metrics)
+        return run_all_files_command(args, metrics)
+    finally:
+        if metrics is not None:
+            write_phase_metrics(args, metrics)
+
 
+def run_all_files_command(args: argparse.Namespace, metrics) -> int:
     package_dir = Path(args.package_dir)
     instances_dir = Path(args.instances)
     output_dir = Path(args.output)
     if not instances_dir.is_dir():
         print(f"Instances directory not found: {instances_dir}")
         return 1
-    instance_paths = sorted(instances_dir.glob("*.json"))
 
+    from .decision_model_package.array_instance import list_instance_paths, result_name
+
+    instance_paths = list_instance_paths(instances_dir)
     if not instance_paths:
-        print(f"No instance JSON files found in {instances_dir}")
+        print(f"No instance files found in {instances_dir}")
         return 1
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for instance_path in instance_paths:
-        result = run_package(package_dir, instance_path)
-        payload = json.dumps(result, indent=2, sort_keys=True)
-        output_path = output_dir / instance_path.name
-        output_path.write_text(payload + "\n", encoding="utf-8")
-        if result.get("status") == "error":
+    from .decision_model_package.batch import run_instances
+
+    def on_result(instance_path: Path, result: dict) -> None:
+        write_result(output_dir / result_name(instance_path), result, args.compact)
+
+    manifest = None
+    if args.incremental:
+        from .decision_model_package.manifest import RunManifest
+        from .decision_model_package.result_cache import package_fingerprint
+        from .decision_model_package.validate_package import REQUIRED_FILES
+
+        try:
+            fingerprint = package_fingerprint(package_dir, REQUIRED_FILES)
+        except OSError:
+            fingerprint = None
+        manifest = RunManifest.load(output_dir, fingerprint)
+        manifest.prune(result_name(path) for path in instance_paths)
+        instance_paths = [path for path in instance_paths if not manifest.is_current(path)]
+
+        def on_result(instance_path: Path, result: dict) -> None:
+            write_result(output_dir / result_name(instance_path), result, args.compact)
+            manifest.record(instance_path, result)
+
+    try:
+        if not instance_paths:
+            return 0
+        return run_instances(
+            package_dir,
+            instance_paths,
+            record_phase_metrics(on_result, metrics),
+            jobs=args.jobs or default_jobs(),
+            result_cache=build_result_cache(args),
+            limits=build_run_limits(args),
+            fail_fast=args.fail_fast,
+        )
+    finally:
+        if manifest is not None:
+            manifest.save()
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must not be negative")
+    return number
+
+
+def bench_command(args: argparse.Namespace) -> int:
+    missing = [name for name in ("jsonschema", "yaml") if find_spec(name) is None]
+    if missing:
+        print("Missing required dependencies: jsonschema, PyYAML")
+        print("Install with: pip install jsonschema PyYAML")
+        return 1
+
+    instances_dir = Path(args.instances)
+    if not instances_dir.is_dir():
+        print(f"Instances directory not found: {instances_dir}")
+        return 1
+
+    from .decision_model_package.array_instance import list_instance_paths, result_name
+
+    instance_paths = list_instance_paths(instances_dir)
+    if not instance_paths:
+        print(f"No instance files found in {instances_dir}")
+        return 1
+
+    from .decision_model_package.bench import render_csv, run_benchmark
+
+    on_result = None
+    if args.results:
+        results_dir = Path(args.results)
+        results_dir.mkdir(parents=True, exist_ok=True)
+
+        def on_result(instance_path: Path, result: dict) -> None:
+            write_result(results_dir / result_name(instance_path), result)
+
+    summary = run_benchmark(
+        Path(args.package_dir),
+        instance_paths,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        limits=build_run_limits(args),
+        on_result=on_result,
+        fail_fast=args.fail_fast,
+    )
+
+    output_format = args.format or ("csv" if args.output and args.output.endswith(".csv") else "json")
+    if output_format == "csv":
+        payload = render_csv(summary)
+    else:
+        payload = json.dumps(summary, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        Path(args.output).write_text(payload, encoding="utf-8")
+    else:
+        sys.stdout.write(payload)
+
+    return 1 if any(instance["errors"] for instance in summary["instances"]) else 0
+
+
+def non_negative_float(value: str) -> float:
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must not be negative")
+    return number
+
+
+def compare_command(args: argparse.Namespace) -> int:
+    from .decision_model_package.compare import Thresholds, compare_results
+
+    for source in (Path(args.base), Path(args.new)):
+        if not source.exists():
+            print(f"Results not found: {source}")
             return 1
 
+    thresholds = Thresholds(
+        max_slowdown=args.max_slowdown,
+        max_instance_slowdown=args.max_instance_slowdown,
+        max_objective_regression=args.max_objective_regression,
+        objective_sense=args.objective_sense,
+    )
+    with contextlib.ExitStack() as stack:
+        on_record = None
+        if args.details:
+            details_stream = stack.enter_context(open(args.details, "w", encoding="utf-8"))
+
+            def on_record(record: dict) -> None:
+                details_stream.write(json.dumps(record, sort_keys=True) + "\n")
+
+        summary = compare_results(
+            Path(args.base), Path(args.new), thresholds, timing=args.timing, on_record=on_record
+        )
+
+    print(json.dumps(summary, indent=2, sort_keys=True))
+    return 1 if summary["regressed"] else 0
+
+
+def serve_command(args: argparse.Namespace) -> int:
+    missing = [name for name in ("jsonschema", "yaml") if find_spec(name) is None]
+    if missing:
+        print("Missing required dependencies: jsonschema, PyYAML")
+        print("Install with: pip install jsonschema PyYAML")
+        return 1
+
+    from .decision_model_package.daemon import default_socket_path, serve
+
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+    return serve(socket_path, preload=[Path(path) for path in args.preload])
+
+
+def parse_package_mapping(value: str) -> tuple[str, Path]:
+    name, separator, path = value.partition("=")
+    if not separator or not name or not path:
+        raise argparse.ArgumentTypeError("expected NAME=PACKAGE_DIR")
+    return name, Path(path)
+
+
+def serve_http_command(args: argparse.Namespace) -> int:
+    missing = [name for name in ("jsonschema", "yaml") if find_spec(name) is None]
+    if missing:
+        print("Missing required dependencies: jsonschema, PyYAML")
+        print("Install with: pip install jsonschema PyYAML")
+        return 1
+
+    from .decision_model_package.http_service import discover_packages, serve_http
+
+    packages: dict[str, Path] = {}
+    if args.packages_root:
+        root = Path(args.packages_root)
+        if not root.is_dir():
+            print(f"Packages directory not found: {root}")
+            return 1
+        packages.update(discover_packages(root))
+    for name, package_dir in args.package:
+        packages[name] = package_dir.resolve()
+
+    if not packages:
+        print("No packages registered; use --package NAME=DIR or --packages-root DIR")
+        return 1
+
+    return serve_http(
+        args.host,
+        args.port,
+        packages,
+        workers=args.workers or default_jobs(),
+        max_queue=args.max_queue,
+        quiet=args.quiet,
+    )
+
+
+def cache_command(args: argparse.Namespace) -> int:
+    from .decision_model_package.result_cache import ResultCache
+
+    cache = ResultCache(Path(args.cache_dir) if args.cache_dir else None, max_bytes=args.cache_max_bytes)
+    if args.cache_action == "stats":
+        report = cache.stats()
+    else:
+        report = cache.prune(args.max_bytes)
+    print(json.dumps(report, indent=2, sort_keys=True))
     return 0
 
 
@@ -68,24 +517,219 @@ def build_parser() -> argparse.ArgumentParser:
 
     run_parser = subparsers.add_parser("run", help="Run a Decision Model Package v0.1")
     run_parser.add_argument("package_dir", help="Path to package root")
-    run_parser.add_argument("--instance", required=True, help="Path to instance.json")
+    run_parser.add_argument(
+        "--instance", required=True, help="Path to instance.json, an .npz file or a .npy directory"
+    )
     run_parser.add_argument("--output", help="Optional output path for result JSON")
+    add_compact_argument(run_parser)
+    run_parser.add_argument(
+        "--via-daemon",
+        action="store_true",
+        help="Forward the run to a warm `decisionhub serve` daemon",
+    )
+    run_parser.add_argument("--socket", help="Daemon socket path (default: per-user runtime dir)")
+    run_parser.add_argument(
+        "--cache", action="store_true", help="Reuse cached results for unchanged package + instance"
+    )
+    add_cache_arguments(run_parser)
+    add_limit_arguments(run_parser)
+    add_validation_arguments(run_parser)
+    add_profiling_arguments(run_parser)
     run_parser.set_defaults(func=run_command)
 
     run_all_parser = subparsers.add_parser(
         "run-all", help="Run a Decision Model Package v0.1 across multiple instances"
     )
     run_all_parser.add_argument("package_dir", help="Path to package root")
-    run_all_parser.add_argument("--instances", required=True, help="Path to instances directory")
-    run_all_parser.add_argument("--output", required=True, help="Output directory for result JSON files")
+    run_all_parser.add_argument(
+        "--instances",
+        required=True,
+        help="Instances directory, or an NDJSON file / '-' for stdin with one instance per line",
+    )
+    run_all_parser.add_argument(
+        "--output",
+        required=True,
+        help="Output directory for result JSON files, or an NDJSON file / '-' for stdout",
+    )
+    run_all_parser.add_argument(
+        "--output-format",
+        choices=["files", "ndjson"],
+        default="files",
+        help="One JSON file per instance (default) or one NDJSON record per result",
+    )
+    add_compact_argument(run_all_parser)
+    run_all_parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="Number of worker processes (default: CPU count; 1 runs in-process)",
+    )
+    run_all_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only run instances that are new or changed, or whose package changed; "
+        "remove results of deleted instances",
+    )
+    run_all_parser.add_argument(
+        "--cache", action="store_true", help="Reuse cached results for unchanged package + instance"
+    )
+    add_cache_arguments(run_all_parser)
+    add_limit_arguments(run_all_parser)
+    add_validation_arguments(run_all_parser)
+    add_profiling_arguments(run_all_parser)
     run_all_parser.set_defaults(func=run_all_command)
 
+    bench_parser = subparsers.add_parser(
+        "bench", help="Time repeated runs of a package across instances and summarize them"
+    )
+    bench_parser.add_argument("package_dir", help="Path to package root")
+    bench_parser.add_argument("--instances", required=True, help="Instances directory")
+    bench_parser.add_argument(
+        "--repeat", type=positive_int, default=5, help="Measured runs per instance (default: 5)"
+    )
+    bench_parser.add_argument(
+        "--warmup",
+        type=non_negative_int,
+        default=1,
+        help="Unmeasured runs per instance before measuring (default: 1)",
+    )
+    bench_parser.add_argument(
+        "--output", help="Summary output path (default: stdout); a .csv suffix selects CSV"
+    )
+    bench_parser.add_argument(
+        "--format", choices=["json", "csv"], default=None, help="Summary format (default: json)"
+    )
+    bench_parser.add_argument(
+        "--results",
+        help="Also write the last measured result of each instance into this directory",
+    )
+    add_limit_arguments(bench_parser)
+    add_validation_arguments(bench_parser)
+    bench_parser.set_defaults(func=bench_command)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare two result sets and fail on performance or objective regressions"
+    )
+    compare_parser.add_argument("base", help="Baseline results directory or NDJSON file")
+    compare_parser.add_argument("new", help="New results directory or NDJSON file")
+    compare_parser.add_argument(
+        "--timing",
+        choices=["runtime_seconds", "solve_seconds", "evaluate_seconds"],
+        default="runtime_seconds",
+        help="Timing compared between runs (default: runtime_seconds)",
+    )
+    compare_parser.add_argument(
+        "--objective-sense",
+        choices=["minimize", "maximize"],
+        default="minimize",
+        help="Whether a lower or higher objective is better (default: minimize)",
+    )
+    compare_parser.add_argument(
+        "--max-slowdown",
+        type=positive_float,
+        default=1.10,
+        help="Largest allowed geometric-mean timing ratio new/base (default: 1.10)",
+    )
+    compare_parser.add_argument(
+        "--max-instance-slowdown",
+        type=positive_float,
+        default=None,
+        help="Largest allowed timing ratio of any single instance (default: unchecked)",
+    )
+    compare_parser.add_argument(
+        "--max-objective-regression",
+        type=non_negative_float,
+        default=0.0,
+        help="Largest allowed relative worsening of an objective, e.g. 0.01 for 1%% (default: 0)",
+    )
+    compare_parser.add_argument("--details", help="Write one NDJSON comparison record per instance")
+    compare_parser.set_defaults(func=compare_command)
+
+    cache_parser = subparsers.add_parser("cache", help="Inspect or prune the result cache")
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_action", required=True)
+    cache_stats_parser = cache_subparsers.add_parser("stats", help="Show cache size and entry count")
+    add_cache_arguments(cache_stats_parser)
+    cache_prune_parser = cache_subparsers.add_parser(
+        "prune", help="Evict least recently used entries"
+    )
+    add_cache_arguments(cache_prune_parser)
+    cache_prune_parser.add_argument(
+        "--max-bytes",
+        type=parse_size,
+        default=None,
+        help="Target size after pruning (default: --cache-max-bytes; 0 clears the cache)",
+    )
+    cache_parser.set_defaults(func=cache_command)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Keep prepared packages warm and serve runs over a local Unix socket"
+    )
+    serve_parser.add_argument("--socket", help="Socket path (default: per-user runtime dir)")
+    serve_parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="PACKAGE_DIR",
+        help="Prepare a package at startup (repeatable)",
+    )
+    serve_parser.set_defaults(func=serve_command)
+
+    serve_http_parser = subparsers.add_parser(
+        "serve-http", help="Serve package runs over a local HTTP API"
+    )
+    serve_http_parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    serve_http_parser.add_argument("--port", type=int, default=8080, help="Bind port (default: 8080)")
+    serve_http_parser.add_argument(
+        "--package",
+        action="append",
+        default=[],
+        type=parse_package_mapping,
+        metavar="NAME=DIR",
+        help="Register a package under a name (repeatable)",
+    )
+    serve_http_parser.add_argument(
+        "--packages-root", help="Register every subdirectory with a decision_card.md by its name"
+    )
+    serve_http_parser.add_argument(
+        "--workers", type=positive_int, default=None, help="Worker processes (default: CPU count)"
+    )
+    serve_http_parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=64,
+        help="Instances allowed to wait for a worker before requests get 429 (default: 64)",
+    )
+    serve_http_parser.add_argument("--quiet", action="store_true", help="Disable per-request logging")
+    serve_http_parser.set_defaults(func=serve_http_command)
+
     return parser
 
 
+def check_daemon_options(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject run options that a daemon run would silently ignore."""
+    if not getattr(args, "via_daemon", False):
+        return
+
+    options = {
+        "--cache": args.cache,
+        "--timeout": args.timeout is not None,
+        "--max-memory": args.max_memory is not None,
+        "--fail-fast": args.fail_fast,
+        "--metrics-file": args.metrics_file is not None,
+        "--trace-memory": args.trace_memory,
+    }
+    conflicting = [option for option, given in options.items() if given]
+    if conflicting:
+        parser.error(
+            f"--via-daemon cannot be combined with {', '.join(conflicting)}: "
+            "the daemon runs instances with its own settings"
+        )
+
+
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
+    check_daemon_options(parser, args)
     return args.func(args)
 
 
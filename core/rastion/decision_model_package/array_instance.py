@@ -0,0 +1,319 @@
+"""Binary instance containers with memory-mapped NumPy arrays.
+
+Besides JSON files, the runner accepts two containers for instances with large
+numeric arrays:
+
+- ``<name>.npz``: one ``<field>.npy`` member per array, as written by
+  ``numpy.savez``, plus an optional ``header.json`` member with the remaining
+  (non-array) fields. Stored members are memory-mapped straight from the
+  archive; members written by ``numpy.savez_compressed`` are decompressed into
+  memory.
+- a directory holding one ``<field>.npy`` file per array, memory-mapped, plus
+  an optional ``header.json``.
+
+Each array becomes a top-level instance field holding a read-only array view,
+so ``create_model`` gets the data without a copy or a Python object per
+element. The header is validated against ``instance_schema.json`` as usual.
+Each array is checked against the schema of its field instead of element by
+element. Every nested ``"type": "array"`` level is one dimension, bounded by
+its ``minItems``/``maxItems``. The innermost ``type`` fixes the dtype
+kind (``integer``, ``number`` or ``boolean``), and its ``minimum``/``maximum``
+bounds apply to the values. A field may declare the array exactly under the
+``x-dmp-array`` keyword, which JSON Schema validators ignore::
+
+    "distances": {
+      "type": "array",
+      "items": {"type": "array", "items": {"type": "number"}},
+      "x-dmp-array": {"dtype": ["float32", "float64"], "shape": ["n", "n"]}
+    }
+
+A ``shape`` entry is an exact size, ``null`` for any size, or a name that must
+stand for the same size wherever it is used in the instance.
+
+NumPy is only imported when a binary instance is loaded.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+import zipfile
+from pathlib import Path
+from typing import Any
+
+from . import json_codec
+
+HEADER_NAME = "header.json"
+ARRAY_SUFFIX = ".npy"
+ARRAY_DECLARATION = "x-dmp-array"
+# Dtype kinds allowed for the innermost JSON Schema type of an array field.
+TYPE_KINDS = {"integer": "iu", "number": "iuf", "boolean": "b"}
+# Size of the fixed part of a zip local file header.
+ZIP_LOCAL_HEADER_SIZE = 30
+
+
+class ArrayInstance(dict):
+    """An instance dict whose ``array_fields`` hold NumPy arrays."""
+
+    def __init__(self, header: dict, arrays: dict[str, Any]) -> None:
+        overlap = sorted(set(header) & set(arrays))
+        if overlap:
+            fields = ", ".join(overlap)
+            raise ValueError(f"Fields defined both in {HEADER_NAME} and as arrays: {fields}")
+        super().__init__(header)
+        self.update(arrays)
+        self.array_fields = tuple(sorted(arrays))
+
+
+def is_array_instance(path: Path) -> bool:
+    path = Path(path)
+    return path.suffix == ".npz" or path.is_dir()
+
+
+def list_instance_paths(directory: Path) -> list[Path]:
+    """JSON files, ``.npz`` files and ``.npy`` directories directly in ``directory``."""
+    paths = []
+    for path in Path(directory).iterdir():
+        if path.is_dir():
+            if (path / HEADER_NAME).is_file() or any(path.glob(f"*{ARRAY_SUFFIX}")):
+                paths.append(path)
+        elif path.suffix in {".json", ".npz"}:
+            paths.append(path)
+    return sorted(paths)
+
+
+def result_name(instance_path: Path) -> str:
+    """File name of the result written for an instance."""
+    path = Path(instance_path)
+    if path.suffix == ".json":
+        return path.name
+    return f"{path.stem if path.suffix == '.npz' else path.name}.json"
+
+
+def instance_sha256(instance_path: Path) -> str:
+    """SHA-256 of an instance file, or of every file name and content of a directory."""
+    path = Path(instance_path)
+    members = sorted(child for child in path.iterdir() if child.is_file()) if path.is_dir() else [path]
+    digest = hashlib.sha256()
+    for member in members:
+        if path.is_dir():
+            digest.update(member.name.encode("utf-8") + b"\0")
+        with member.open("rb") as stream:
+            for chunk in iter(lambda: stream.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def import_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("Binary instances (.npz or .npy directories) require NumPy") from exc
+    return numpy
+
+
+def map_npz_member(np: Any, path: Path, archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> Any:
+    if info.flag_bits & 0x1:
+        raise ValueError(f"{path.name}: member {info.filename} is encrypted")
+    if info.compress_type != zipfile.ZIP_STORED:
+        with archive.open(info) as stream:
+            return np.lib.format.read_array(stream, allow_pickle=False)
+
+    with path.open("rb") as stream:
+        # The local header repeats the name and has its own extra field length.
+        stream.seek(info.header_offset + 26)
+        name_length, extra_length = (int.from_bytes(stream.read(2), "little") for _ in range(2))
+        stream.seek(info.header_offset + ZIP_LOCAL_HEADER_SIZE + name_length + extra_length)
+        version = np.lib.format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+        offset = stream.tell()
+    if dtype.hasobject:
+        raise ValueError(f"{path.name}: member {info.filename} holds Python objects")
+    if math.prod(shape) == 0:
+        return np.empty(shape, dtype=dtype, order="F" if fortran_order else "C")
+    return np.memmap(
+        path, dtype=dtype, mode="r", offset=offset, shape=shape, order="F" if fortran_order else "C"
+    )
+
+
+def load_npz(np: Any, path: Path) -> tuple[dict, dict[str, Any]]:
+    header: dict = {}
+    arrays: dict[str, Any] = {}
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if info.filename == HEADER_NAME:
+                header = json_codec.loads(archive.read(info))
+            elif info.filename.endswith(ARRAY_SUFFIX):
+                name = info.filename[: -len(ARRAY_SUFFIX)]
+                arrays[name] = map_npz_member(np, path, archive, info)
+            else:
+                raise ValueError(f"{path.name}: unexpected member {info.filename}")
+    return header, arrays
+
+
+def load_directory(np: Any, path: Path) -> tuple[dict, dict[str, Any]]:
+    header_path = path / HEADER_NAME
+    header = json_codec.loads(header_path.read_bytes()) if header_path.exists() else {}
+    arrays = {}
+    for array_path in sorted(path.glob(f"*{ARRAY_SUFFIX}")):
+        array = np.load(array_path, mmap_mode="r", allow_pickle=False)
+        arrays[array_path.name[: -len(ARRAY_SUFFIX)]] = array
+    return header, arrays
+
+
+def load_array_instance(path: Path) -> ArrayInstance:
+    """Load an ``.npz`` file or ``.npy`` directory with its arrays memory-mapped."""
+    np = import_numpy()
+    path = Path(path)
+    header, arrays = load_directory(np, path) if path.is_dir() else load_npz(np, path)
+    if not isinstance(header, dict):
+        raise ValueError(f"{HEADER_NAME} must hold a JSON object")
+    return ArrayInstance(header, arrays)
+
+
+def resolve_ref(schema: Any, root: dict) -> Any:
+    """Follow local ``#/...`` references, the only kind instance schemas use for fields."""
+    seen = 0
+    while isinstance(schema, dict) and isinstance(schema.get("$ref"), str):
+        ref = schema["$ref"]
+        if not ref.startswith("#/") or seen > 32:
+            return schema
+        node: Any = root
+        for part in ref[2:].split("/"):
+            part = part.replace("~1", "/").replace("~0", "~")
+            if not isinstance(node, dict) or part not in node:
+                return schema
+            node = node[part]
+        schema = node
+        seen += 1
+    return schema
+
+
+def describe_array(field_schema: Any, root: dict) -> tuple[list[tuple[Any, Any]], dict]:
+    """``([(minItems, maxItems) per dimension], innermost item schema)`` of a field.
+
+    A scalar field has no dimensions; its own schema is the item schema.
+    """
+    dimensions = []
+    node = resolve_ref(field_schema, root)
+    while isinstance(node, dict) and node.get("type") == "array":
+        dimensions.append((node.get("minItems"), node.get("maxItems")))
+        node = resolve_ref(node.get("items", {}), root)
+    return dimensions, node if isinstance(node, dict) else {}
+
+
+def check_dtype(np: Any, array: Any, declared: Any, item_type: Any) -> str | None:
+    if declared is not None:
+        names = declared if isinstance(declared, list) else [declared]
+        if array.dtype not in {np.dtype(name) for name in names}:
+            return f"dtype {array.dtype} is not one of {', '.join(map(str, names))}"
+    if item_type is None:
+        return None
+    types = item_type if isinstance(item_type, list) else [item_type]
+    kinds = "".join(TYPE_KINDS.get(name, "") for name in types if isinstance(name, str))
+    if array.dtype.kind not in kinds:
+        return f"dtype {array.dtype} does not match schema type {item_type!r}"
+    return None
+
+
+def check_shape(
+    shape: tuple[int, ...],
+    dimensions: list[tuple[Any, Any]],
+    declared: Any,
+    symbols: dict[str, tuple[str, int]],
+    name: str,
+    constrained: bool,
+) -> str | None:
+    if declared is not None:
+        if len(declared) != len(shape):
+            return f"shape {shape} does not have the {len(declared)} declared dimension(s)"
+        for axis, (size, expected) in enumerate(zip(shape, declared)):
+            if isinstance(expected, int) and size != expected:
+                return f"axis {axis} has size {size}, expected {expected}"
+            if isinstance(expected, str):
+                bound = symbols.setdefault(expected, (name, size))
+                if bound[1] != size:
+                    return f"axis {axis} has size {size}, but '{expected}' is {bound[1]} in {bound[0]}"
+    elif constrained and len(dimensions) != len(shape):
+        return f"shape {shape} does not have the {len(dimensions)} dimension(s) of the schema"
+    for axis, (size, (min_items, max_items)) in enumerate(zip(shape, dimensions)):
+        if isinstance(min_items, int) and size < min_items:
+            return f"axis {axis} has size {size}, fewer than minItems {min_items}"
+        if isinstance(max_items, int) and size > max_items:
+            return f"axis {axis} has size {size}, more than maxItems {max_items}"
+    return None
+
+
+def check_values(np: Any, array: Any, item_schema: dict) -> str | None:
+    if array.size == 0 or array.dtype.kind not in "iuf":
+        return None
+    if array.dtype.kind == "f" and not np.isfinite(array).all():
+        return "values must be finite"
+    low = high = None
+    for keyword, is_lower, strict in (
+        ("minimum", True, False),
+        ("exclusiveMinimum", True, True),
+        ("maximum", False, False),
+        ("exclusiveMaximum", False, True),
+    ):
+        limit = item_schema.get(keyword)
+        if isinstance(limit, bool) or not isinstance(limit, (int, float)):
+            continue
+        if is_lower:
+            low = array.min() if low is None else low
+            if low < limit or (strict and low == limit):
+                return f"value {low} violates {keyword} {limit}"
+        else:
+            high = array.max() if high is None else high
+            if high > limit or (strict and high == limit):
+                return f"value {high} violates {keyword} {limit}"
+    return None
+
+
+def collect_array_errors(schema: dict, instance: ArrayInstance, fail_fast: bool = False) -> list[str]:
+    """Check each array field's dtype, shape and value bounds against ``schema``."""
+    np = import_numpy()
+    properties = schema.get("properties") if isinstance(schema.get("properties"), dict) else {}
+    symbols: dict[str, tuple[str, int]] = {}
+    errors = []
+    for name in instance.array_fields:
+        array = instance[name]
+        field_schema = properties.get(name, {})
+        # Read the declaration before following a $ref it may sit next to.
+        declaration = field_schema.get(ARRAY_DECLARATION) if isinstance(field_schema, dict) else None
+        if declaration is None:
+            resolved = resolve_ref(field_schema, schema)
+            declaration = resolved.get(ARRAY_DECLARATION) if isinstance(resolved, dict) else None
+        declaration = declaration if isinstance(declaration, dict) else {}
+        dimensions, item_schema = describe_array(field_schema, schema)
+        item_type = item_schema.get("type")
+        # Fields without an array or type schema accept any shape.
+        constrained = bool(dimensions) or item_type is not None
+        error = (
+            check_dtype(np, array, declaration.get("dtype"), item_type)
+            or check_shape(
+                array.shape, dimensions, declaration.get("shape"), symbols, name, constrained
+            )
+            or check_values(np, array, item_schema)
+        )
+        if error:
+            errors.append(f"{name}{ARRAY_SUFFIX}: {error}")
+            if fail_fast:
+                break
+    return errors
+
+
+def header_schema(schema: dict, array_fields: tuple[str, ...]) -> dict:
+    """``schema`` with the array fields accepted as-is, for validating the header."""
+    properties = dict(schema.get("properties") or {})
+    for name in array_fields:
+        if name in properties:
+            properties[name] = True
+    return {**schema, "properties": properties}
+
+
+def header_view(instance: ArrayInstance) -> dict:
+    """The instance with each array replaced by a placeholder, for schema validation."""
+    return {name: None if name in instance.array_fields else value for name, value in instance.items()}
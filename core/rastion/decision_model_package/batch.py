@@ -0,0 +1,212 @@
+"""Run one package across many instances, in-process or on a process pool.
+
+Instances come either as files (``run_instances``) or as raw JSON records from a
+stream (``run_stream``). Results are handed to an ``on_result(key, result)``
+callback as soon as each instance finishes. At most a small window of instances
+is in flight at once, so memory stays flat however long the input is.
+Execution stops at the first error result, matching ``decisionhub run-all``.
+"""
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Iterator, Sequence, TextIO
+
+from .result_cache import ResultCache
+from .runner import PreparedPackage, build_error_result, prepare_package
+from .supervisor import RunLimits
+
+ResultCallback = Callable[[Any, dict], None]
+
+# In-flight instances per worker when dispatching to a pool.
+PENDING_PER_WORKER = 2
+
+_WORKER_PACKAGE: PreparedPackage | None = None
+
+
+def init_worker(
+    package_dir: Path,
+    result_cache: ResultCache | None,
+    limits: RunLimits | None,
+    fail_fast: bool = False,
+) -> None:
+    global _WORKER_PACKAGE
+    _WORKER_PACKAGE = prepare_package(
+        package_dir, result_cache=result_cache, limits=limits, fail_fast=fail_fast
+    )
+
+
+def run_path_in_worker(instance_path: Path) -> dict:
+    return _WORKER_PACKAGE.run_path(instance_path)
+
+
+def run_bytes_in_worker(data: bytes) -> dict:
+    return _WORKER_PACKAGE.run_bytes(data)
+
+
+def worker_crash_result(exc: BaseException) -> dict:
+    return build_error_result(
+        ["DMP_WORKER_CRASHED: worker process terminated unexpectedly"],
+        0.0,
+        metadata={"error_type": "DMP_WORKER_CRASHED", "message": str(exc)},
+    )
+
+
+def iter_ndjson_records(stream: TextIO, source: str) -> Iterator[tuple[str, bytes]]:
+    """Yield ``("<source>:<line>", raw_json)`` for each non-blank line."""
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield f"{source}:{line_number}", line.encode("utf-8")
+
+
+def run_sequential(
+    package_dir: Path,
+    items: Iterable[tuple[Hashable, Any]],
+    on_result: ResultCallback,
+    from_bytes: bool,
+    result_cache: ResultCache | None = None,
+    limits: RunLimits | None = None,
+    fail_fast: bool = False,
+) -> int:
+    prepared = prepare_package(
+        package_dir, result_cache=result_cache, limits=limits, fail_fast=fail_fast
+    )
+    execute = prepared.run_bytes if from_bytes else prepared.run_path
+    for key, payload in items:
+        result = execute(payload)
+        on_result(key, result)
+        if result.get("status") == "error":
+            return 1
+
+    return 0
+
+
+def run_isolated(worker: Callable[[Any], dict], payload: Any, initargs: tuple) -> dict:
+    """Run one instance on a fresh single-worker pool; a crash there is its own."""
+    executor = ProcessPoolExecutor(max_workers=1, initializer=init_worker, initargs=initargs)
+    try:
+        return executor.submit(worker, payload).result()
+    except BrokenProcessPool as exc:
+        return worker_crash_result(exc)
+    finally:
+        executor.shutdown(wait=True)
+
+
+def run_parallel(
+    package_dir: Path,
+    items: Iterable[tuple[Hashable, Any]],
+    on_result: ResultCallback,
+    from_bytes: bool,
+    jobs: int,
+    result_cache: ResultCache | None = None,
+    limits: RunLimits | None = None,
+    fail_fast: bool = False,
+) -> int:
+    worker = run_bytes_in_worker if from_bytes else run_path_in_worker
+    initargs = (package_dir, result_cache, limits, fail_fast)
+    max_pending = jobs * PENDING_PER_WORKER
+    pending: dict[Future, tuple[Hashable, Any]] = {}
+    exit_code = 0
+
+    def new_executor() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=initargs)
+
+    def report(key: Hashable, result: dict) -> None:
+        nonlocal exit_code
+        on_result(key, result)
+        if result.get("status") == "error":
+            exit_code = 1
+
+    def collect(futures: Iterable[Future]) -> list[tuple[Hashable, Any]]:
+        """Report finished futures; return the items lost to a broken pool."""
+        suspects = []
+        for future in futures:
+            key, payload = pending.pop(future)
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                suspects.append((key, payload))
+                continue
+            report(key, result)
+        return suspects
+
+    def recover(suspects: list[tuple[Hashable, Any]]) -> None:
+        # A worker died (segfault, OOM kill, os._exit) and took the whole pool
+        # down with it, failing every instance in flight. Start a new pool and
+        # re-run each of those instances alone, so only the one that kills
+        # its own worker again is recorded as crashed.
+        nonlocal executor
+        suspects = collect(wait(pending).done) + suspects
+        executor.shutdown(wait=False)
+        executor = new_executor()
+        for key, payload in suspects:
+            report(key, run_isolated(worker, payload, initargs))
+
+    def drain(return_when: str) -> None:
+        suspects = collect(wait(pending, return_when=return_when).done)
+        if suspects:
+            recover(suspects)
+
+    executor = new_executor()
+    try:
+        for key, payload in items:
+            try:
+                pending[executor.submit(worker, payload)] = (key, payload)
+            except BrokenProcessPool:
+                # The pool broke while this item was waiting to be submitted.
+                recover([(key, payload)])
+            while len(pending) >= max_pending and exit_code == 0:
+                drain(FIRST_COMPLETED)
+            if exit_code:
+                break
+
+        while pending and exit_code == 0:
+            drain(FIRST_COMPLETED)
+
+        for future in pending:
+            future.cancel()
+    finally:
+        executor.shutdown(wait=True)
+
+    return exit_code
+
+
+def run_instances(
+    package_dir: Path,
+    instance_paths: Sequence[Path],
+    on_result: ResultCallback,
+    jobs: int = 1,
+    result_cache: ResultCache | None = None,
+    limits: RunLimits | None = None,
+    fail_fast: bool = False,
+) -> int:
+    """Run every instance file and return 0, or 1 once an error result was produced."""
+    items = ((path, path) for path in instance_paths)
+    jobs = min(jobs, len(instance_paths))
+    if jobs <= 1:
+        return run_sequential(
+            package_dir, items, on_result, False, result_cache, limits, fail_fast
+        )
+    return run_parallel(
+        package_dir, items, on_result, False, jobs, result_cache, limits, fail_fast
+    )
+
+
+def run_stream(
+    package_dir: Path,
+    records: Iterable[tuple[Hashable, bytes]],
+    on_result: ResultCallback,
+    jobs: int = 1,
+    result_cache: ResultCache | None = None,
+    limits: RunLimits | None = None,
+    fail_fast: bool = False,
+) -> int:
+    """Run raw JSON instance records (e.g. NDJSON lines) with bounded memory."""
+    if jobs <= 1:
+        return run_sequential(
+            package_dir, records, on_result, True, result_cache, limits, fail_fast
+        )
+    return run_parallel(
+        package_dir, records, on_result, True, jobs, result_cache, limits, fail_fast
+    )
@@ -0,0 +1,134 @@
+"""Repeated-run benchmarking of one package across many instances.
+
+Each instance runs ``warmup`` times unmeasured and then ``repeat`` times on the
+same prepared package. Per instance, the summary reports the median, p95 and
+minimum of ``runtime_seconds`` and of ``metadata.runner.solve_seconds`` and
+``evaluate_seconds``, and whether status and objective stayed the same over the
+measured runs. Results are never served from the result cache.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import math
+import statistics
+from pathlib import Path
+from typing import Callable, Sequence
+
+from .runner import prepare_package
+from .supervisor import RunLimits
+
+TIMING_FIELDS = ("runtime_seconds", "solve_seconds", "evaluate_seconds")
+STATISTICS = ("median", "p95", "min")
+CSV_COLUMNS = (
+    ["instance", "runs", "errors", "status"]
+    + [f"{field}_{stat}" for field in TIMING_FIELDS for stat in STATISTICS]
+    + ["objective_min", "objective_max", "objective_stable"]
+)
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of non-empty ``samples``."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_timings(samples: Sequence[float]) -> dict | None:
+    if not samples:
+        return None
+    return {
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "min": min(samples),
+    }
+
+
+def run_timings(result: dict) -> dict[str, float | None]:
+    runner = result.get("metadata", {}).get("runner") or {}
+    return {
+        "runtime_seconds": result.get("runtime_seconds"),
+        "solve_seconds": runner.get("solve_seconds"),
+        "evaluate_seconds": runner.get("evaluate_seconds"),
+    }
+
+
+def summarize_instance(name: str, results: Sequence[dict]) -> dict:
+    timings = [run_timings(result) for result in results]
+    statuses = sorted({str(result.get("status")) for result in results})
+    objectives = [result.get("objective") for result in results]
+    numeric = [value for value in objectives if isinstance(value, (int, float))]
+    summary = {
+        "instance": name,
+        "runs": len(results),
+        "errors": sum(1 for result in results if result.get("status") == "error"),
+        "status": statuses[0] if len(statuses) == 1 else "mixed",
+        "objective": {
+            "min": min(numeric) if numeric else None,
+            "max": max(numeric) if numeric else None,
+            "stable": len(statuses) == 1 and len({repr(value) for value in objectives}) <= 1,
+        },
+    }
+    for field in TIMING_FIELDS:
+        samples = [run[field] for run in timings if isinstance(run[field], (int, float))]
+        summary[field] = summarize_timings(samples)
+    return summary
+
+
+def run_benchmark(
+    package_dir: Path,
+    instance_paths: Sequence[Path],
+    repeat: int,
+    warmup: int = 0,
+    limits: RunLimits | None = None,
+    on_result: Callable[[Path, dict], None] | None = None,
+    fail_fast: bool = False,
+) -> dict:
+    """Benchmark every instance and return the aggregate summary.
+
+    ``on_result`` receives the last measured result of each instance. An
+    instance stops repeating at its first error result.
+    """
+    prepared = prepare_package(package_dir, limits=limits, fail_fast=fail_fast)
+    instances = []
+    for instance_path in instance_paths:
+        results: list[dict] = []
+        for _ in range(warmup):
+            if prepared.run_path(instance_path).get("status") == "error":
+                break
+        for _ in range(repeat):
+            result = prepared.run_path(instance_path)
+            results.append(result)
+            if result.get("status") == "error":
+                break
+        if on_result is not None:
+            on_result(instance_path, results[-1])
+        instances.append(summarize_instance(instance_path.name, results))
+
+    return {
+        "package": str(package_dir),
+        "repeat": repeat,
+        "warmup": warmup,
+        "instances": instances,
+    }
+
+
+def render_csv(summary: dict) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    for instance in summary["instances"]:
+        row = {
+            "instance": instance["instance"],
+            "runs": instance["runs"],
+            "errors": instance["errors"],
+            "status": instance["status"],
+            "objective_min": instance["objective"]["min"],
+            "objective_max": instance["objective"]["max"],
+            "objective_stable": instance["objective"]["stable"],
+        }
+        for field in TIMING_FIELDS:
+            for stat in STATISTICS:
+                row[f"{field}_{stat}"] = (instance[field] or {}).get(stat)
+        writer.writerow(row)
+    return buffer.getvalue()
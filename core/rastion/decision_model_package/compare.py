@@ -0,0 +1,174 @@
+"""Compare two sets of run results for performance and quality regressions.
+
+Each side is a results directory written by ``run``/``run-all`` (one
+``<instance>.json`` per instance) or an NDJSON file written by
+``run-all --output-format ndjson``. Results are matched by instance name. Only
+a few numbers per base instance are kept in memory; the new side is streamed
+one result at a time, so large result sets compare in flat memory.
+
+An instance regresses when its timing ratio (new / base) exceeds the
+per-instance slowdown limit, its objective got worse by more than the allowed
+relative amount, it lost feasibility, it turned into an error, or it is missing
+from the new side. The geometric mean of the timing ratios is checked against
+its own limit.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from . import json_codec
+
+
+@dataclass(frozen=True)
+class Thresholds:
+    max_slowdown: float | None = 1.10
+    max_instance_slowdown: float | None = None
+    max_objective_regression: float = 0.0
+    objective_sense: str = "minimize"
+
+
+@dataclass(frozen=True)
+class ResultSummary:
+    status: str | None
+    feasible: bool | None
+    objective: float | None
+    seconds: float | None
+
+
+def summarize_result(result: dict, timing: str) -> ResultSummary:
+    if timing == "runtime_seconds":
+        seconds = result.get("runtime_seconds")
+    else:
+        runner = result.get("metadata", {}).get("runner") or {}
+        seconds = runner.get(timing)
+    objective = result.get("objective")
+    return ResultSummary(
+        status=result.get("status"),
+        feasible=result.get("feasible"),
+        objective=float(objective) if isinstance(objective, (int, float)) else None,
+        seconds=float(seconds) if isinstance(seconds, (int, float)) else None,
+    )
+
+
+def iter_results(source: Path) -> Iterator[tuple[str, dict]]:
+    """Yield ``(instance name, result)`` from a results directory or NDJSON file."""
+    if source.is_dir():
+        for path in sorted(source.glob("*.json")):
+            if path.name.startswith("."):  # e.g. the run-all --incremental manifest
+                continue
+            yield path.name, json_codec.loads(path.read_bytes())
+        return
+
+    with source.open("rb") as stream:
+        for line in stream:
+            if line.strip():
+                record = json_codec.loads(line)
+                yield str(record["instance"]), record["result"]
+
+
+def objective_regression(base: float, new: float, sense: str) -> float:
+    """Relative amount by which ``new`` is worse than ``base`` (0 if not worse)."""
+    worse = new - base if sense == "minimize" else base - new
+    if worse <= 0:
+        return 0.0
+    return worse / abs(base) if base else math.inf
+
+
+def compare_instance(
+    name: str, base: ResultSummary | None, new: ResultSummary | None, thresholds: Thresholds
+) -> dict:
+    record: dict = {"instance": name, "regressions": []}
+    if base is None:
+        record["change"] = "added"
+        return record
+    if new is None:
+        record["change"] = "missing"
+        record["regressions"].append("missing")
+        return record
+
+    record["status"] = {"base": base.status, "new": new.status}
+    if new.status == "error" and base.status != "error":
+        record["regressions"].append("error")
+    if base.feasible is not None and new.feasible is not None and base.feasible != new.feasible:
+        record["feasibility"] = "lost" if base.feasible else "gained"
+        if base.feasible:
+            record["regressions"].append("feasibility")
+
+    if base.seconds and new.seconds is not None and base.status != "error" and new.status != "error":
+        ratio = new.seconds / base.seconds
+        record["runtime_ratio"] = ratio
+        limit = thresholds.max_instance_slowdown
+        if limit is not None and ratio > limit:
+            record["regressions"].append("slowdown")
+
+    if base.objective is not None and new.objective is not None:
+        record["objective_delta"] = new.objective - base.objective
+        worse = objective_regression(base.objective, new.objective, thresholds.objective_sense)
+        if worse > thresholds.max_objective_regression:
+            record["regressions"].append("objective")
+    return record
+
+
+def compare_results(
+    base_source: Path,
+    new_source: Path,
+    thresholds: Thresholds,
+    timing: str = "runtime_seconds",
+    on_record: Callable[[dict], None] | None = None,
+) -> dict:
+    """Compare ``new_source`` against ``base_source`` and return the summary.
+
+    ``on_record`` receives each per-instance comparison as soon as it is made:
+    first the instances of the new side in its order, then instances missing
+    from it.
+    """
+    base_index = {
+        name: summarize_result(result, timing) for name, result in iter_results(base_source)
+    }
+    log_ratio_sum = 0.0
+    ratio_count = 0
+    counts = {"compared": 0, "added": 0, "missing": 0, "regressed": 0}
+    regression_counts: dict[str, int] = {}
+
+    def account(record: dict) -> None:
+        nonlocal log_ratio_sum, ratio_count
+        change = record.get("change")
+        if change:
+            counts[change] += 1
+        else:
+            counts["compared"] += 1
+        ratio = record.get("runtime_ratio")
+        if ratio is not None and ratio > 0:
+            log_ratio_sum += math.log(ratio)
+            ratio_count += 1
+        if record["regressions"]:
+            counts["regressed"] += 1
+            for reason in record["regressions"]:
+                regression_counts[reason] = regression_counts.get(reason, 0) + 1
+        if on_record is not None:
+            on_record(record)
+
+    seen: set[str] = set()
+    for name, result in iter_results(new_source):
+        seen.add(name)
+        new = summarize_result(result, timing)
+        account(compare_instance(name, base_index.get(name), new, thresholds))
+    for name in base_index:
+        if name not in seen:
+            account(compare_instance(name, base_index[name], None, thresholds))
+
+    geomean = math.exp(log_ratio_sum / ratio_count) if ratio_count else None
+    if geomean is not None and thresholds.max_slowdown is not None and geomean > thresholds.max_slowdown:
+        regression_counts["geomean_slowdown"] = 1
+
+    return {
+        "timing": timing,
+        "objective_sense": thresholds.objective_sense,
+        "geomean_runtime_ratio": geomean,
+        "instances": counts,
+        "regressions": regression_counts,
+        "regressed": bool(regression_counts),
+    }
@@ -0,0 +1,198 @@
+"""Warm-worker daemon for low-latency runs over a local Unix socket.
+
+``decisionhub serve`` keeps prepared packages in memory so a request only pays
+for loading the instance and calling ``create_model -> solve -> evaluate``.
+``decisionhub run --via-daemon`` forwards a run to it.
+
+The wire protocol is one JSON object per line in each direction. A request is
+``{"package_dir": ..., "instance_path": ...}`` (or ``"instance"`` with an
+inline object); the response is ``{"result": {...}}`` or ``{"error": "..."}``.
+"""
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from . import json_codec
+
+
+def default_socket_path() -> Path:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"decisionhub-{os.getuid()}.sock"
+
+
+def package_stat_fingerprint(package_dir: Path) -> tuple:
+    """Cheap change detector for a package: (mtime_ns, size) of each required file."""
+    from .validation import REQUIRED_FILES
+
+    fingerprint = []
+    for name in REQUIRED_FILES:
+        try:
+            stat = (package_dir / name).stat()
+        except OSError:
+            fingerprint.append(None)
+            continue
+        fingerprint.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+class PackageRegistry:
+    """Thread-safe map of package directories to prepared packages.
+
+    A package is re-prepared when any of its required files changes on disk.
+    """
+
+    def __init__(self) -> None:
+        self._packages: dict[Path, tuple[tuple, Any]] = {}
+        self._package_locks: dict[Path, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, package_dir: Path) -> tuple[Any, bool]:
+        """Return ``(prepared_package, was_cached)``."""
+        from .runner import prepare_package
+
+        resolved = Path(package_dir).resolve()
+        fingerprint = package_stat_fingerprint(resolved)
+        with self._lock:
+            entry = self._packages.get(resolved)
+            if entry is not None and entry[0] == fingerprint:
+                return entry[1], True
+            package_lock = self._package_locks.setdefault(resolved, threading.Lock())
+
+        # Prepare outside the registry lock so other packages stay servable;
+        # the per-package lock keeps concurrent requests from preparing twice.
+        with package_lock:
+            fingerprint = package_stat_fingerprint(resolved)
+            with self._lock:
+                entry = self._packages.get(resolved)
+            if entry is not None and entry[0] == fingerprint:
+                return entry[1], True
+
+            prepared = prepare_package(resolved)
+            with self._lock:
+                self._packages[resolved] = (fingerprint, prepared)
+            return prepared, False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._packages)
+
+
+def handle_request(registry: PackageRegistry, request: dict) -> dict:
+    received = time.perf_counter()
+    package_dir = request.get("package_dir")
+    if not isinstance(package_dir, str):
+        return {"error": "request must include a package_dir string"}
+
+    prepared, cached = registry.get(Path(package_dir))
+    if isinstance(request.get("instance"), dict):
+        result = prepared.run(request["instance"])
+    elif isinstance(request.get("instance_path"), str):
+        result = prepared.run_path(Path(request["instance_path"]))
+    else:
+        return {"error": "request must include an instance object or an instance_path string"}
+
+    runner_metadata = result["metadata"].setdefault("runner", {})
+    runner_metadata["via_daemon"] = True
+    runner_metadata["package_cached"] = cached
+    runner_metadata["request_seconds"] = time.perf_counter() - received
+    return {"result": result}
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+                response = handle_request(self.server.registry, request)
+            except Exception as exc:
+                response = {"error": f"{type(exc).__name__}: {exc}"}
+            self.wfile.write(json_codec.dumps(response, compact=True) + b"\n")
+            self.wfile.flush()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path) -> None:
+        self.registry = PackageRegistry()
+        super().__init__(str(socket_path), DaemonRequestHandler)
+
+
+def socket_is_live(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def stop_on_signal(signum: int, frame: Any) -> None:
+    raise KeyboardInterrupt
+
+
+def serve(socket_path: Path, preload: list[Path] | None = None) -> int:
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        if socket_is_live(socket_path):
+            print(f"A daemon is already listening on {socket_path}")
+            return 1
+        socket_path.unlink()
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    server = DaemonServer(socket_path)
+    os.chmod(socket_path, 0o600)
+    for package_dir in preload or []:
+        server.registry.get(package_dir)
+
+    print(f"decisionhub daemon listening on {socket_path}", flush=True)
+    signal.signal(signal.SIGTERM, stop_on_signal)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path.exists():
+            socket_path.unlink()
+    return 0
+
+
+def request_run(socket_path: Path, package_dir: Path, instance_path: Path) -> dict:
+    """Send one run request to a daemon and return its result object.
+
+    Raises ``ConnectionError`` if no daemon is listening and ``RuntimeError`` if
+    the daemon rejected the request.
+    """
+    request = {
+        "package_dir": str(Path(package_dir).resolve()),
+        "instance_path": str(Path(instance_path).resolve()),
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError as exc:
+            raise ConnectionError(f"No daemon listening on {socket_path}: {exc}") from exc
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with client.makefile("rb") as stream:
+            line = stream.readline()
+
+    if not line:
+        raise ConnectionError(f"Daemon on {socket_path} closed the connection")
+    response = json_codec.loads(line)
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response["result"]
@@ -0,0 +1,296 @@
+"""Local HTTP execution service for Decision Model Packages.
+
+Endpoints:
+
+- ``POST /packages/{name}/run``: body is one instance object; responds with the
+  runner result object.
+- ``POST /packages/{name}/run-batch``: body is a list of instance objects (or
+  ``{"instances": [...]}``); responds with ``{"results": [...]}`` in input order.
+- ``GET /packages``: registered package names and directories.
+- ``GET /health``: pool size and current load.
+
+Solves run in a bounded process pool. Each worker prepares a package on first
+use and keeps it warm. A request that would push the number of queued and
+running instances past ``workers + max_queue`` is rejected with ``429``.
+"""
+from __future__ import annotations
+
+import signal
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from . import json_codec
+from .daemon import PackageRegistry, stop_on_signal
+
+_WORKER_REGISTRY: PackageRegistry | None = None
+
+
+def run_instance_in_worker(package_dir: str, instance: Any) -> dict:
+    global _WORKER_REGISTRY
+    if _WORKER_REGISTRY is None:
+        _WORKER_REGISTRY = PackageRegistry()
+    prepared, cached = _WORKER_REGISTRY.get(Path(package_dir))
+    result = prepared.run(instance)
+    result["metadata"].setdefault("runner", {})["package_cached"] = cached
+    return result
+
+
+def run_instance_isolated(package_dir: str, instance: Any) -> dict:
+    """Run one instance on a fresh single-worker pool; a crash there is its own."""
+    from .batch import worker_crash_result
+
+    executor = ProcessPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(run_instance_in_worker, package_dir, instance).result()
+    except BrokenProcessPool as exc:
+        return worker_crash_result(exc)
+    finally:
+        executor.shutdown(wait=True)
+
+
+def discover_packages(root: Path) -> dict[str, Path]:
+    """Map each subdirectory of ``root`` holding a decision_card.md to its name."""
+    return {
+        path.name: path.resolve()
+        for path in sorted(Path(root).iterdir())
+        if path.is_dir() and (path / "decision_card.md").is_file()
+    }
+
+
+class SolvePool:
+    """Process pool with admission control on queued + running instances."""
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self.workers = workers
+        self.capacity = workers + max_queue
+        self._inflight = 0
+        self._lock = threading.Lock()
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        # Crash retries run one at a time, so a crash under load adds at most
+        # one process to the pool.
+        self._retries = ThreadPoolExecutor(max_workers=1, thread_name_prefix="solve-retry")
+
+    @property
+    def inflight(self) -> int:
+        with self._lock:
+            return self._inflight
+
+    def try_submit(self, package_dir: Path, instances: list[Any]) -> list[Future] | None:
+        """Submit all instances or none; ``None`` means the pool is saturated."""
+        with self._lock:
+            if self._inflight + len(instances) > self.capacity:
+                return None
+            self._inflight += len(instances)
+
+        futures: list[Future] = []
+        try:
+            for instance in instances:
+                future = self._submit(package_dir, instance)
+                future.add_done_callback(self._release)
+                futures.append(future)
+        finally:
+            # Slots reserved for instances that never got a future.
+            with self._lock:
+                self._inflight -= len(instances) - len(futures)
+        return futures
+
+    def _submit(self, package_dir: Path, instance: Any) -> Future:
+        """Run one instance on the shared pool; the returned future always settles.
+
+        A worker crash breaks the whole executor and fails every instance in
+        flight on it, whichever request it came from. Each of those is retried
+        alone on a single-worker pool, one retry at a time, so only an instance
+        that crashes its own worker again gets a DMP_WORKER_CRASHED result.
+        """
+        outcome: Future = Future()
+        outcome.set_running_or_notify_cancel()
+        args = (str(package_dir), instance)
+
+        executor = self._executor
+        try:
+            attempt = executor.submit(run_instance_in_worker, *args)
+        except BrokenProcessPool:
+            executor = self._replace_executor(executor)
+            attempt = executor.submit(run_instance_in_worker, *args)
+
+        def settle(done: Future) -> None:
+            try:
+                result = done.result()
+            except BrokenProcessPool:
+                try:
+                    self._replace_executor(executor)
+                    self._retries.submit(run_instance_isolated, *args).add_done_callback(settle)
+                except BaseException as exc:  # e.g. the pool is shutting down
+                    outcome.set_exception(exc)
+            except BaseException as exc:
+                outcome.set_exception(exc)
+            else:
+                outcome.set_result(result)
+
+        attempt.add_done_callback(settle)
+        return outcome
+
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is broken:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            executor = self._executor
+        broken.shutdown(wait=False)
+        return executor
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._inflight -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._retries.shutdown(wait=True, cancel_futures=True)
+
+
+class ExecutionRequestHandler(BaseHTTPRequestHandler):
+    server: "ExecutionServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def send_json(self, status: HTTPStatus, payload: Any, headers: dict | None = None) -> None:
+        body = json_codec.dumps(payload, compact=True)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status: HTTPStatus, message: str, headers: dict | None = None) -> None:
+        self.send_json(status, {"error": message}, headers)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            pool = self.server.pool
+            self.send_json(
+                HTTPStatus.OK,
+                {"workers": pool.workers, "capacity": pool.capacity, "inflight": pool.inflight},
+            )
+        elif self.path == "/packages":
+            packages = {name: str(path) for name, path in self.server.packages.items()}
+            self.send_json(HTTPStatus.OK, {"packages": packages})
+        else:
+            self.send_error_json(HTTPStatus.NOT_FOUND, f"Unknown path: {self.path}")
+
+    def do_POST(self) -> None:
+        received = time.perf_counter()
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 3 or parts[0] != "packages" or parts[2] not in {"run", "run-batch"}:
+            self.send_error_json(HTTPStatus.NOT_FOUND, f"Unknown path: {self.path}")
+            return
+
+        name, action = parts[1], parts[2]
+        package_dir = self.server.packages.get(name)
+        if package_dir is None:
+            self.send_error_json(HTTPStatus.NOT_FOUND, f"Unknown package: {name}")
+            return
+
+        length_header = self.headers.get("Content-Length")
+        if length_header is None:
+            self.close_connection = True
+            self.send_error_json(HTTPStatus.LENGTH_REQUIRED, "Content-Length header is required")
+            return
+        length = int(length_header) if length_header.strip().isdigit() else -1
+        if length < 0:
+            # Without a usable length the body cannot be skipped; drop the connection.
+            self.close_connection = True
+            self.send_error_json(HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {length_header!r}")
+            return
+
+        try:
+            body = json_codec.loads(self.rfile.read(length) or b"null")
+        except ValueError as exc:
+            self.send_error_json(HTTPStatus.BAD_REQUEST, f"Request body is not valid JSON: {exc}")
+            return
+
+        if action == "run":
+            instances = [body]
+        elif isinstance(body, list):
+            instances = body
+        elif isinstance(body, dict) and isinstance(body.get("instances"), list):
+            instances = body["instances"]
+        else:
+            self.send_error_json(
+                HTTPStatus.BAD_REQUEST, "run-batch expects a list of instances or {\"instances\": [...]}"
+            )
+            return
+
+        try:
+            futures = self.server.pool.try_submit(package_dir, instances)
+            if futures is None:
+                self.send_error_json(
+                    HTTPStatus.TOO_MANY_REQUESTS,
+                    "Solve queue is full; retry later",
+                    headers={"Retry-After": "1"},
+                )
+                return
+            results = [future.result() for future in futures]
+        except Exception as exc:
+            self.send_error_json(HTTPStatus.INTERNAL_SERVER_ERROR, f"Failed to run instances: {exc}")
+            return
+
+        request_seconds = time.perf_counter() - received
+        for result in results:
+            result["metadata"].setdefault("runner", {})["request_seconds"] = request_seconds
+
+        if action == "run":
+            self.send_json(HTTPStatus.OK, results[0])
+        else:
+            self.send_json(HTTPStatus.OK, {"results": results})
+
+
+class ExecutionServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        packages: dict[str, Path],
+        pool: SolvePool,
+        quiet: bool = False,
+    ) -> None:
+        self.packages = packages
+        self.pool = pool
+        self.quiet = quiet
+        super().__init__(address, ExecutionRequestHandler)
+
+
+def serve_http(
+    host: str,
+    port: int,
+    packages: dict[str, Path],
+    workers: int,
+    max_queue: int,
+    quiet: bool = False,
+) -> int:
+    pool = SolvePool(workers, max_queue)
+    server = ExecutionServer((host, port), packages, pool, quiet=quiet)
+    print(
+        f"decisionhub HTTP service on http://{host}:{server.server_address[1]} "
+        f"({len(packages)} packages, {workers} workers, queue {max_queue})",
+        flush=True,
+    )
+    signal.signal(signal.SIGTERM, stop_on_signal)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.shutdown()
+    return 0
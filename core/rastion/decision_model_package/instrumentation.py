@@ -0,0 +1,124 @@
+"""Per-phase wall-clock, CPU and memory measurements for the runner.
+
+Each phase records wall-clock seconds, process CPU seconds and the process
+peak RSS (``ru_maxrss``, a high-water mark) at the end of the phase. While
+tracemalloc is tracing (``PYTHONTRACEMALLOC=1`` or ``--trace-memory``), the peak
+of traced Python allocations during the phase is recorded as well.
+
+Results carry their phases under ``metadata.runner.phases``; ``PhaseMetrics``
+aggregates them across runs into Prometheus text exposition format.
+"""
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+# (metric name, type, aggregated field, help text)
+PROMETHEUS_METRICS = (
+    ("rastion_runner_phase_runs_total", "counter", "count", "Number of times each runner phase ran."),
+    (
+        "rastion_runner_phase_wall_seconds_total",
+        "counter",
+        "wall_seconds",
+        "Wall-clock seconds spent per runner phase.",
+    ),
+    (
+        "rastion_runner_phase_cpu_seconds_total",
+        "counter",
+        "cpu_seconds",
+        "Process CPU seconds spent per runner phase.",
+    ),
+    (
+        "rastion_runner_phase_peak_rss_bytes",
+        "gauge",
+        "peak_rss_bytes",
+        "Highest process peak RSS observed at the end of a phase.",
+    ),
+    (
+        "rastion_runner_phase_tracemalloc_peak_bytes",
+        "gauge",
+        "tracemalloc_peak_bytes",
+        "Highest traced allocation peak within a phase.",
+    ),
+)
+
+
+def peak_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class PhaseRecorder:
+    """Ordered mapping of phase name to its measurements."""
+
+    def __init__(self, phases: dict[str, dict] | None = None) -> None:
+        self.phases: dict[str, dict] = dict(phases or {})
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            record = {
+                "wall_seconds": time.perf_counter() - wall_start,
+                "cpu_seconds": time.process_time() - cpu_start,
+                "peak_rss_bytes": peak_rss_bytes(),
+            }
+            if tracing:
+                record["tracemalloc_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            self.phases[name] = record
+
+    def seconds(self, name: str) -> float:
+        return self.phases[name]["wall_seconds"]
+
+
+class PhaseMetrics:
+    """Aggregate ``metadata.runner.phases`` of many results."""
+
+    def __init__(self) -> None:
+        self.totals: dict[str, dict] = {}
+
+    def add(self, result: dict) -> None:
+        runner = result.get("metadata", {}).get("runner")
+        phases = runner.get("phases") if isinstance(runner, dict) else None
+        if not isinstance(phases, dict):
+            return
+        for name, record in phases.items():
+            total = self.totals.setdefault(
+                name, {"count": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0}
+            )
+            total["count"] += 1
+            total["wall_seconds"] += record.get("wall_seconds", 0.0)
+            total["cpu_seconds"] += record.get("cpu_seconds", 0.0)
+            for gauge in ("peak_rss_bytes", "tracemalloc_peak_bytes"):
+                if record.get(gauge) is not None:
+                    total[gauge] = max(total.get(gauge, 0), record[gauge])
+
+    def render(self) -> str:
+        """Render the totals in Prometheus text exposition format."""
+        lines = []
+        for metric, kind, field, help_text in PROMETHEUS_METRICS:
+            samples = [(name, total[field]) for name, total in self.totals.items() if field in total]
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, value in samples:
+                lines.append(f'{metric}{{phase="{name}"}} {value}')
+        return "\n".join(lines) + "\n" if lines else ""
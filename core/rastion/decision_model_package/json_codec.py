@@ -0,0 +1,113 @@
+"""JSON encoding and decoding for runner I/O on the fastest installed backend.
+
+Instances and results go through orjson when it is installed, then msgspec,
+then the standard library. Set ``RASTION_JSON_BACKEND`` to ``orjson``,
+``msgspec`` or ``json`` to pick one explicitly.
+
+Every backend decodes straight from bytes, without a decoded ``str`` copy, and
+encodes to UTF-8 bytes with sorted keys, either indented by two spaces or
+compact. The fast backends reject a few documents the standard library accepts
+(``NaN`` literals, integers beyond 64 bits, unsupported object types). Those
+calls are retried with the standard library, so invalid input is reported with
+the same error messages whichever backend is active. Non-finite floats are
+written as ``null`` by orjson and msgspec.
+"""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Callable
+
+BACKENDS = ("orjson", "msgspec", "json")
+BACKEND_ENV = "RASTION_JSON_BACKEND"
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    name: str
+    loads: Callable[[bytes | str], Any]
+    dumps: Callable[[Any, bool], bytes]
+
+
+def stdlib_dumps(obj: Any, compact: bool = False) -> bytes:
+    if compact:
+        text = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    else:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=True)
+    return text.encode("utf-8")
+
+
+def stdlib_codec() -> JsonCodec:
+    return JsonCodec("json", json.loads, stdlib_dumps)
+
+
+def orjson_codec() -> JsonCodec:
+    import orjson
+
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def dumps(obj: Any, compact: bool = False) -> bytes:
+        try:
+            return orjson.dumps(obj, option=options if compact else options | orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            return stdlib_dumps(obj, compact)
+
+    return JsonCodec("orjson", loads, dumps)
+
+
+def msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder(order="sorted")
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+
+    def dumps(obj: Any, compact: bool = False) -> bytes:
+        try:
+            payload = encoder.encode(obj)
+        except (TypeError, ValueError, OverflowError, msgspec.EncodeError):
+            return stdlib_dumps(obj, compact)
+        return payload if compact else msgspec.json.format(payload, indent=2)
+
+    return JsonCodec("msgspec", loads, dumps)
+
+
+FACTORIES = {"orjson": orjson_codec, "msgspec": msgspec_codec, "json": stdlib_codec}
+
+
+def get_codec(name: str | None = None) -> JsonCodec:
+    """The named backend, or the first installed one of :data:`BACKENDS`."""
+    if name:
+        if name not in FACTORIES:
+            raise ValueError(f"Unknown JSON backend: {name!r} (expected one of {', '.join(BACKENDS)})")
+        return FACTORIES[name]()
+    for backend in BACKENDS:
+        try:
+            return FACTORIES[backend]()
+        except ImportError:
+            continue
+    return stdlib_codec()
+
+
+CODEC = get_codec(os.environ.get(BACKEND_ENV))
+
+
+def loads(data: bytes | str) -> Any:
+    return CODEC.loads(data)
+
+
+def dumps(obj: Any, compact: bool = False) -> bytes:
+    """UTF-8 JSON with sorted keys; indented by two spaces unless ``compact``."""
+    return CODEC.dumps(obj, compact)
@@ -0,0 +1,98 @@
+"""Manifest of up-to-date results for incremental ``run-all``.
+
+The manifest lives in the output directory and records, per result file, the
+SHA-256 of the instance bytes (of every file, for a directory instance) and the
+package fingerprint it was produced with.
+An instance is re-executed only when it is new, its bytes changed, the package
+changed, or its result file is missing. Only non-error results are recorded,
+so failed instances are always retried.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+from .array_instance import instance_sha256, result_name
+
+MANIFEST_NAME = ".rastion-manifest.json"
+MANIFEST_VERSION = 1
+
+
+class RunManifest:
+    def __init__(self, output_dir: Path, package_fingerprint: str | None) -> None:
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_NAME
+        self.package_fingerprint = package_fingerprint
+        self.entries: dict[str, dict] = {}
+        self._instance_digests: dict[str, str] = {}
+
+    @classmethod
+    def load(cls, output_dir: Path, package_fingerprint: str | None) -> "RunManifest":
+        manifest = cls(output_dir, package_fingerprint)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return manifest
+        if isinstance(data, dict) and data.get("version") == MANIFEST_VERSION:
+            entries = data.get("results")
+            if isinstance(entries, dict):
+                manifest.entries = {
+                    name: entry for name, entry in entries.items() if isinstance(entry, dict)
+                }
+        return manifest
+
+    def instance_digest(self, instance_path: Path) -> str:
+        name = result_name(instance_path)
+        if name not in self._instance_digests:
+            self._instance_digests[name] = instance_sha256(instance_path)
+        return self._instance_digests[name]
+
+    def is_current(self, instance_path: Path) -> bool:
+        if self.package_fingerprint is None:
+            return False
+        name = result_name(instance_path)
+        entry = self.entries.get(name)
+        if entry is None or not (self.output_dir / name).is_file():
+            return False
+        return (
+            entry.get("package_fingerprint") == self.package_fingerprint
+            and entry.get("instance_sha256") == self.instance_digest(instance_path)
+        )
+
+    def record(self, instance_path: Path, result: dict) -> None:
+        name = result_name(instance_path)
+        if result.get("status") == "error" or self.package_fingerprint is None:
+            self.entries.pop(name, None)
+            return
+        self.entries[name] = {
+            "instance_sha256": self.instance_digest(instance_path),
+            "package_fingerprint": self.package_fingerprint,
+        }
+
+    def prune(self, instance_names: Iterable[str]) -> list[str]:
+        """Delete recorded results whose instance no longer exists; return their names."""
+        keep = set(instance_names)
+        removed = sorted(name for name in self.entries if name not in keep)
+        for name in removed:
+            (self.output_dir / name).unlink(missing_ok=True)
+            del self.entries[name]
+        return removed
+
+    def save(self) -> None:
+        payload = {
+            "version": MANIFEST_VERSION,
+            "package_fingerprint": self.package_fingerprint,
+            "results": dict(sorted(self.entries.items())),
+        }
+        handle, temp_name = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                json.dump(payload, stream, indent=2, sort_keys=True)
+                stream.write("\n")
+            os.replace(temp_name, self.path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,148 @@
+"""Content-addressed on-disk cache of runner results.
+
+A cache key is the SHA-256 of the package fingerprint (``model.py``,
+``evaluate.py``, ``solver.yaml`` and ``instance_schema.json``) and the raw
+instance bytes, so any edit to the package or the instance is a miss. Entries
+are plain JSON files; their mtime doubles as the LRU clock and the cache is
+pruned oldest-first once it grows past ``max_bytes``.
+
+Only non-error results are stored. Packages whose ``solver.yaml`` sets
+``parameters.deterministic: false`` are never cached.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from . import json_codec
+
+FINGERPRINT_FILES = ("model.py", "evaluate.py", "solver.yaml", "instance_schema.json")
+DEFAULT_MAX_BYTES = 1024**3
+
+
+def default_cache_dir() -> Path:
+    configured = os.environ.get("RASTION_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "rastion" / "results"
+
+
+def package_fingerprint(package_dir: Path, files: Sequence[str] = FINGERPRINT_FILES) -> str:
+    digests = {
+        name: hashlib.sha256((Path(package_dir) / name).read_bytes()).hexdigest() for name in files
+    }
+    return fingerprint_from_digests(digests, files)
+
+
+def fingerprint_from_digests(digests: dict[str, str], files: Sequence[str] = FINGERPRINT_FILES) -> str:
+    """Fingerprint from per-file SHA-256 hex digests (e.g. gathered during validation)."""
+    digest = hashlib.sha256()
+    for name in files:
+        digest.update(name.encode("utf-8") + b"\0")
+        digest.update(bytes.fromhex(digests[name]))
+    return digest.hexdigest()
+
+
+def is_cacheable(solver_config: dict) -> bool:
+    parameters = solver_config.get("parameters") if isinstance(solver_config, dict) else None
+    if not isinstance(parameters, dict):
+        return True
+    return parameters.get("deterministic", True) is not False
+
+
+class ResultCache:
+    """Size-bounded LRU of result JSON files under ``root``."""
+
+    def __init__(self, root: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self._approx_bytes: int | None = None
+
+    def key(self, package_fingerprint: str, instance_bytes: bytes) -> str:
+        digest = hashlib.sha256()
+        digest.update(package_fingerprint.encode("ascii"))
+        digest.update(b"\0")
+        digest.update(instance_bytes)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        path = self._entry_path(key)
+        try:
+            result = json_codec.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result: dict) -> None:
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json_codec.dumps(result, compact=True)
+        # Write-then-rename so concurrent readers never see a partial entry.
+        handle, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                stream.write(payload)
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        if self._approx_bytes is None:
+            self._approx_bytes = self.stats()["total_bytes"]
+        else:
+            self._approx_bytes += len(payload)
+        if self._approx_bytes > self.max_bytes:
+            self.prune()
+
+    def _entries(self) -> Iterator[tuple[Path, os.stat_result]]:
+        if not self.root.is_dir():
+            return
+        for path in self.root.glob("??/*.json"):
+            try:
+                yield path, path.stat()
+            except FileNotFoundError:
+                continue
+
+    def stats(self) -> dict:
+        entries = 0
+        total_bytes = 0
+        for _, stat in self._entries():
+            entries += 1
+            total_bytes += stat.st_size
+        return {
+            "root": str(self.root),
+            "entries": entries,
+            "total_bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def prune(self, max_bytes: int | None = None) -> dict:
+        """Evict least recently used entries until the cache fits in ``max_bytes``."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime_ns)
+        total_bytes = sum(stat.st_size for _, stat in entries)
+        removed = 0
+        freed = 0
+        for path, stat in entries:
+            if total_bytes <= limit:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total_bytes -= stat.st_size
+            freed += stat.st_size
+            removed += 1
+        self._approx_bytes = total_bytes
+        return {"removed": removed, "freed_bytes": freed, "total_bytes": total_bytes}
@@ -5,7 +5,6 @@ from __future__ import annotations
 import argparse
 import importlib.util
 import inspect
-import json
 import sys
 import time
 import traceback
@@ -15,13 +14,26 @@ from typing import Any, Callable, Dict
 import jsonschema
 import yaml
 
-from .validate_package import validate_package
+from . import json_codec
+from .array_instance import (
+    ArrayInstance,
+    collect_array_errors,
+    header_schema,
+    header_view,
+    is_array_instance,
+    load_array_instance,
+)
+from .instrumentation import PhaseRecorder
+from .result_cache import ResultCache, fingerprint_from_digests, is_cacheable
+from .schema_cache import VALIDATOR_CACHE
+from .supervisor import RunLimits, run_supervised
+from .validation import schema_dialect, validate
 
 ALLOWED_STATUSES = {"feasible", "optimal", "infeasible", "error"}
 
 
 def load_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json_codec.loads(path.read_bytes())
 
 
 def load_yaml(path: Path) -> dict:
@@ -45,11 +57,52 @@ def call_with_supported_args(func: Callable[..., Any], **kwargs: Any) -> Any:
     return func(**filtered)
 
 
-def validate_instance(instance: dict, schema_path: Path) -> list[str]:
-    schema = load_json(schema_path)
-    validator = jsonschema.Draft202012Validator(schema)
+def instance_validator_class(schema: Any) -> type:
+    """Validator class of the dialect declared in ``$schema`` (draft 2020-12 if none)."""
+    return schema_dialect(schema) or jsonschema.Draft202012Validator
+
+
+def compile_instance_validator(
+    schema: dict, digest: str | None = None
+) -> jsonschema.protocols.Validator:
+    return VALIDATOR_CACHE.validator(schema, instance_validator_class(schema), digest=digest)
+
+
+def load_instance_validator(schema_path: Path) -> jsonschema.protocols.Validator:
+    digest, schema = VALIDATOR_CACHE.load_schema_file(schema_path)
+    return compile_instance_validator(schema, digest=digest)
+
+
+def collect_instance_errors(
+    validator: jsonschema.protocols.Validator,
+    instance: dict,
+    fail_fast: bool = False,
+    label: str = "instance.json",
+) -> list[str]:
+    """Instance validation messages; with ``fail_fast`` only the first error found."""
+    if fail_fast:
+        error = next(validator.iter_errors(instance), None)
+        return [] if error is None else [f"{label}: {error.message}"]
     errors = sorted(validator.iter_errors(instance), key=lambda err: err.path)
-    return [f"instance.json: {error.message}" for error in errors]
+    return [f"{label}: {error.message}" for error in errors]
+
+
+def collect_array_instance_errors(
+    validator: jsonschema.protocols.Validator, instance: ArrayInstance, fail_fast: bool = False
+) -> list[str]:
+    """Validate the header with the instance schema, then each array's dtype and shape."""
+    schema = validator.schema
+    header_validator = VALIDATOR_CACHE.validator(
+        header_schema(schema, instance.array_fields), type(validator)
+    )
+    errors = collect_instance_errors(header_validator, header_view(instance), fail_fast, "header.json")
+    if errors and fail_fast:
+        return errors
+    return errors + collect_array_errors(schema, instance, fail_fast)
+
+
+def validate_instance(instance: dict, schema_path: Path, fail_fast: bool = False) -> list[str]:
+    return collect_instance_errors(load_instance_validator(schema_path), instance, fail_fast)
 
 
 def normalize_status(solve_status: Any, feasible: Any) -> str:
@@ -105,43 +158,274 @@ def build_error_result(
     )
 
 
-def run_package(package_dir: Path, instance_path: Path) -> dict:
-    start_time = time.perf_counter()
-    solver_config: dict = {}
+def exception_diagnostics(exc: BaseException) -> dict:
+    return {
+        "error_type": type(exc).__name__,
+        "message": str(exc),
+        "traceback": traceback.format_exc(),
+    }
 
-    try:
-        validation_errors = validate_package(package_dir)
-        if validation_errors:
-            runtime = time.perf_counter() - start_time
-            return build_error_result(validation_errors, runtime)
 
-        solver_config = load_yaml(package_dir / "solver.yaml")
-        instance = load_json(instance_path)
-        instance_errors = validate_instance(instance, package_dir / "instance_schema.json")
-        if instance_errors:
+class PreparedPackage:
+    """A package validated, configured and imported once, ready to run many instances.
+
+    Preparation performs the instance-independent steps of the execution flow:
+    package validation, loading ``solver.yaml``, compiling the instance schema
+    with the dialect its ``$schema`` declares and importing ``model.py`` /
+    ``evaluate.py``. Failures are recorded rather than raised, so every
+    subsequent :meth:`run` returns the same error result the one-shot runner
+    would have produced.
+
+    With a :class:`ResultCache`, runs of a successfully prepared, deterministic
+    package are looked up by package fingerprint and instance bytes first. With
+    active :class:`RunLimits` (or ``parameters.time_limit_seconds`` in
+    solver.yaml), each validated instance runs in a supervised child process.
+    With ``fail_fast``, an invalid instance is reported by its first validation
+    error only, instead of collecting and sorting all of them.
+
+    Every result reports per-phase timings under ``metadata.runner.phases``; the
+    preparation phases are reported once, on the first result.
+    """
+
+    def __init__(
+        self,
+        package_dir: Path,
+        result_cache: ResultCache | None = None,
+        limits: RunLimits | None = None,
+        fail_fast: bool = False,
+    ) -> None:
+        self.package_dir = Path(package_dir)
+        self.result_cache = result_cache
+        self.limits = limits or RunLimits()
+        self.fail_fast = fail_fast
+        self.fingerprint: str | None = None
+        self.solver_config: dict = {}
+        self.validation_errors: list[str] = []
+        self._validation_issues: list[dict] = []
+        self.prepare_seconds = 0.0
+        self._prepare_phases = PhaseRecorder()
+        self._instance_validator: jsonschema.protocols.Validator | None = None
+        self._model_module: Any = None
+        self._evaluate_module: Any = None
+        self._load_failure: dict | None = None
+        self._import_failure: dict | None = None
+        self._prepare()
+
+    @property
+    def ok(self) -> bool:
+        return not (self.validation_errors or self._load_failure or self._import_failure)
+
+    def _prepare(self) -> None:
+        start_time = time.perf_counter()
+        recorder = self._prepare_phases
+        try:
+            try:
+                with recorder.phase("validate_package"):
+                    report = validate(self.package_dir)
+                self.validation_errors = report.messages
+                self._validation_issues = [error.as_dict() for error in report.errors]
+                if self.validation_errors:
+                    return
+                # Validation already parsed solver.yaml and the instance schema.
+                self.solver_config = report.solver_config
+                with recorder.phase("load_instance_schema"):
+                    self._instance_validator = compile_instance_validator(
+                        report.instance_schema, digest=report.instance_schema_digest
+                    )
+            except Exception as exc:
+                self._load_failure = exception_diagnostics(exc)
+                return
+
+            try:
+                with recorder.phase("import_modules"):
+                    self._model_module = import_module(self.package_dir / "model.py", "dmp_model")
+                    self._evaluate_module = import_module(
+                        self.package_dir / "evaluate.py", "dmp_evaluate"
+                    )
+            except Exception as exc:
+                # Surfaced only after instance validation, matching the
+                # execution order of the one-shot runner.
+                self._import_failure = exception_diagnostics(exc)
+                return
+
+            self.limits = self.limits.with_solver_config(self.solver_config)
+            if self.result_cache is not None and is_cacheable(self.solver_config):
+                self.fingerprint = fingerprint_from_digests(report.file_digests)
+        finally:
+            self.prepare_seconds = time.perf_counter() - start_time
+
+    def _new_recorder(self) -> PhaseRecorder:
+        # Hand the preparation phases to the first run only, so summing the
+        # phases of all results counts each preparation exactly once.
+        recorder, self._prepare_phases = self._prepare_phases, PhaseRecorder()
+        return recorder
+
+    def run(self, instance: dict) -> dict:
+        """Execute create_model -> solve -> evaluate for an already parsed instance."""
+        start_time = time.perf_counter()
+        recorder = self._new_recorder()
+        if self.fingerprint is None:
+            return self._execute(lambda: instance, start_time, recorder)
+        instance_bytes = json_codec.dumps(instance, compact=True)
+        return self._execute_cached(instance_bytes, lambda: instance, start_time, recorder)
+
+    def run_path(self, instance_path: Path) -> dict:
+        """Load an instance JSON file (or binary container) and execute it."""
+        start_time = time.perf_counter()
+        instance_path = Path(instance_path)
+        recorder = self._new_recorder()
+        if is_array_instance(instance_path):
+            # Memory-mapped containers are never read whole, so they bypass the cache.
+            return self._execute(lambda: load_array_instance(instance_path), start_time, recorder)
+        if self.fingerprint is None:
+            return self._execute(lambda: load_json(instance_path), start_time, recorder)
+        try:
+            instance_bytes = instance_path.read_bytes()
+        except OSError:
+            # Let the uncached path report the failure as usual.
+            return self._execute(lambda: load_json(instance_path), start_time, recorder)
+        return self._execute_cached(
+            instance_bytes, lambda: json_codec.loads(instance_bytes), start_time, recorder
+        )
+
+    def run_bytes(self, data: bytes) -> dict:
+        """Parse a raw JSON instance (e.g. one NDJSON record) and execute it."""
+        start_time = time.perf_counter()
+        recorder = self._new_recorder()
+        if self.fingerprint is None:
+            return self._execute(lambda: json_codec.loads(data), start_time, recorder)
+        return self._execute_cached(data, lambda: json_codec.loads(data), start_time, recorder)
+
+    def _execute_cached(
+        self,
+        instance_bytes: bytes,
+        load_instance: Callable[[], dict],
+        start_time: float,
+        recorder: PhaseRecorder,
+    ) -> dict:
+        with recorder.phase("cache_lookup"):
+            key = self.result_cache.key(self.fingerprint, instance_bytes)
+            result = self.result_cache.get(key)
+        if result is not None:
+            runner_metadata = result["metadata"].setdefault("runner", {})
+            runner_metadata["cache_hit"] = True
+            # The stored phases belong to the run that produced the entry.
+            runner_metadata["phases"] = recorder.phases
+            return result
+
+        result = self._execute(load_instance, start_time, recorder)
+        if result.get("status") != "error":
+            self.result_cache.put(key, result)
+        result["metadata"].setdefault("runner", {})["cache_hit"] = False
+        return result
+
+    def _execute(
+        self, load_instance: Callable[[], dict], start_time: float, recorder: PhaseRecorder
+    ) -> dict:
+        result = self._execute_phases(load_instance, start_time, recorder)
+        result["metadata"].setdefault("runner", {}).setdefault("phases", recorder.phases)
+        return result
+
+    def _execute_phases(
+        self, load_instance: Callable[[], dict], start_time: float, recorder: PhaseRecorder
+    ) -> dict:
+        if self.validation_errors:
+            return build_error_result(
+                self.validation_errors,
+                time.perf_counter() - start_time,
+                metadata={
+                    "error_type": "DMP_PACKAGE_INVALID",
+                    "validation_errors": self._validation_issues,
+                },
+            )
+
+        solver_config = self.solver_config
+        try:
+            if self._load_failure:
+                return build_error_result(
+                    ["DMP_RUNTIME_ERROR: unexpected failure during execution"],
+                    time.perf_counter() - start_time,
+                    solver=solver_config,
+                    metadata=dict(self._load_failure),
+                )
+
+            with recorder.phase("load_instance"):
+                instance = load_instance()
+            with recorder.phase("validate_instance"):
+                if isinstance(instance, ArrayInstance):
+                    instance_errors = collect_array_instance_errors(
+                        self._instance_validator, instance, self.fail_fast
+                    )
+                else:
+                    instance_errors = collect_instance_errors(
+                        self._instance_validator, instance, self.fail_fast
+                    )
+            if instance_errors:
+                runtime = time.perf_counter() - start_time
+                return build_error_result(
+                    instance_errors,
+                    runtime,
+                    solver=solver_config,
+                    metadata={"error_type": "DMP_INPUT_INVALID"},
+                )
+
+            if self._import_failure:
+                return build_error_result(
+                    ["DMP_RUNTIME_ERROR: unexpected failure during execution"],
+                    time.perf_counter() - start_time,
+                    solver=solver_config,
+                    metadata=dict(self._import_failure),
+                )
+
+        except Exception as exc:
             runtime = time.perf_counter() - start_time
             return build_error_result(
-                instance_errors,
+                ["DMP_RUNTIME_ERROR: unexpected failure during execution"],
                 runtime,
                 solver=solver_config,
-                metadata={"error_type": "DMP_INPUT_INVALID"},
+                metadata=exception_diagnostics(exc),
             )
 
-        model_module = import_module(package_dir / "model.py", "dmp_model")
-        evaluate_module = import_module(package_dir / "evaluate.py", "dmp_evaluate")
+        if self.limits.active:
+            return run_supervised(self, instance, start_time, self.limits, recorder)
+        return self._run_validated(instance, start_time, recorder)
 
-        model = call_with_supported_args(
-            model_module.create_model, instance=instance, solver_config=solver_config
-        )
+    def _run_validated(self, instance: dict, start_time: float, recorder: PhaseRecorder) -> dict:
+        try:
+            result = self._solve_and_evaluate(instance, start_time, recorder)
+        except Exception as exc:
+            runtime = time.perf_counter() - start_time
+            result = build_error_result(
+                ["DMP_RUNTIME_ERROR: unexpected failure during execution"],
+                runtime,
+                solver=self.solver_config,
+                metadata=exception_diagnostics(exc),
+            )
+        result["metadata"].setdefault("runner", {})["phases"] = recorder.phases
+        return result
 
-        solve_start = time.perf_counter()
-        solve_result = call_with_supported_args(
-            model_module.solve,
-            model=model,
-            instance=instance,
-            solver_config=solver_config,
-        )
-        solve_runtime = time.perf_counter() - solve_start
+    def __reduce__(self):
+        # Modules cannot be pickled; a spawned supervisor child re-prepares.
+        return (PreparedPackage, (self.package_dir, None, self.limits, self.fail_fast))
+
+    def _solve_and_evaluate(self, instance: dict, start_time: float, recorder: PhaseRecorder) -> dict:
+        solver_config = self.solver_config
+        model_module = self._model_module
+        evaluate_module = self._evaluate_module
+
+        with recorder.phase("create_model"):
+            model = call_with_supported_args(
+                model_module.create_model, instance=instance, solver_config=solver_config
+            )
+
+        with recorder.phase("solve"):
+            solve_result = call_with_supported_args(
+                model_module.solve,
+                model=model,
+                instance=instance,
+                solver_config=solver_config,
+            )
+        solve_runtime = recorder.seconds("solve")
 
         if not isinstance(solve_result, dict):
             runtime = time.perf_counter() - start_time
@@ -152,14 +436,14 @@ def run_package(package_dir: Path, instance_path: Path) -> dict:
             )
 
         solution_payload = solve_result.get("solution", solve_result)
-        evaluate_start = time.perf_counter()
-        evaluation = call_with_supported_args(
-            evaluate_module.evaluate,
-            solution=solution_payload,
-            instance=instance,
-            runtime=solve_runtime,
-        )
-        evaluate_runtime = time.perf_counter() - evaluate_start
+        with recorder.phase("evaluate"):
+            evaluation = call_with_supported_args(
+                evaluate_module.evaluate,
+                solution=solution_payload,
+                instance=instance,
+                runtime=solve_runtime,
+            )
+        evaluate_runtime = recorder.seconds("evaluate")
 
         if not isinstance(evaluation, dict):
             runtime = time.perf_counter() - start_time
@@ -202,19 +486,33 @@ def run_package(package_dir: Path, instance_path: Path) -> dict:
             solver=solver_config,
             metadata=metadata,
         )
-    except Exception as exc:
-        runtime = time.perf_counter() - start_time
-        diagnostics = {
-            "error_type": type(exc).__name__,
-            "message": str(exc),
-            "traceback": traceback.format_exc(),
-        }
-        return build_error_result(
-            ["DMP_RUNTIME_ERROR: unexpected failure during execution"],
-            runtime,
-            solver=solver_config,
-            metadata=diagnostics,
-        )
+
+
+def prepare_package(
+    package_dir: Path,
+    result_cache: ResultCache | None = None,
+    limits: RunLimits | None = None,
+    fail_fast: bool = False,
+) -> PreparedPackage:
+    return PreparedPackage(
+        package_dir, result_cache=result_cache, limits=limits, fail_fast=fail_fast
+    )
+
+
+def run_package(
+    package_dir: Path,
+    instance_path: Path,
+    result_cache: ResultCache | None = None,
+    limits: RunLimits | None = None,
+    fail_fast: bool = False,
+) -> dict:
+    prepared = prepare_package(
+        package_dir, result_cache=result_cache, limits=limits, fail_fast=fail_fast
+    )
+    result = prepared.run_path(instance_path)
+    # The one-shot runner reports the full execution, preparation included.
+    result["runtime_seconds"] += prepared.prepare_seconds
+    return result
 
 
 def main() -> int:
@@ -222,15 +520,23 @@ def main() -> int:
     parser.add_argument("package_dir", type=Path, help="Path to package root")
     parser.add_argument("--instance", required=True, type=Path, help="Path to instance.json")
     parser.add_argument("--output", type=Path, help="Optional output path for result JSON")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Report only the first instance validation error",
+    )
+    parser.add_argument(
+        "--compact", action="store_true", help="Write the result JSON without indentation"
+    )
     args = parser.parse_args()
 
-    result = run_package(args.package_dir, args.instance)
-    payload = json.dumps(result, indent=2, sort_keys=True)
+    result = run_package(args.package_dir, args.instance, fail_fast=args.fail_fast)
+    payload = json_codec.dumps(result, compact=args.compact)
 
     if args.output:
-        args.output.write_text(payload + "\n", encoding="utf-8")
+        args.output.write_bytes(payload + b"\n")
     else:
-        print(payload)
+        print(payload.decode("utf-8"))
 
     return 0 if result.get("status") != "error" else 1
 
@@ -0,0 +1,124 @@
+"""Process-wide cache of compiled JSON Schema validators.
+
+Validators are keyed by a SHA-256 digest of the schema content, so two paths
+holding the same schema share one compiled validator and an edited schema never
+reuses a stale one. Schema files are additionally tracked by ``(mtime, size)``
+so unchanged files are neither re-read nor re-hashed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+import jsonschema
+import yaml
+
+DEFAULT_MAX_ENTRIES = 128
+
+Parser = Callable[[bytes], Any]
+
+
+def parse_json_bytes(data: bytes) -> Any:
+    return json.loads(data)
+
+
+def parse_yaml_bytes(data: bytes) -> Any:
+    return yaml.safe_load(data)
+
+
+def schema_digest(schema: Any) -> str:
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ValidatorCache:
+    """Bounded LRU of compiled validators plus a stat-keyed schema file cache."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._validators: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._files: OrderedDict[tuple[str, str], tuple[int, int, str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load_schema_file(self, path: Path, parse: Parser = parse_json_bytes) -> tuple[str, Any]:
+        """Return ``(digest, document)`` for a schema file, re-reading only if it changed."""
+        resolved = str(Path(path).resolve())
+        key = (resolved, getattr(parse, "__qualname__", repr(parse)))
+        stat = os.stat(resolved)
+        with self._lock:
+            cached = self._files.get(key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._files.move_to_end(key)
+                return cached[2], cached[3]
+
+        data = Path(resolved).read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        document = parse(data)
+        with self._lock:
+            self._files[key] = (stat.st_mtime_ns, stat.st_size, digest, document)
+            self._files.move_to_end(key)
+            while len(self._files) > self.max_entries:
+                self._files.popitem(last=False)
+        return digest, document
+
+    def validator(
+        self,
+        schema: Any,
+        validator_cls: type = jsonschema.Draft202012Validator,
+        digest: str | None = None,
+    ) -> Any:
+        """Return a compiled validator for ``schema``, building it on first use."""
+        key = (digest or schema_digest(schema), validator_cls.__name__)
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+                self.hits += 1
+                return validator
+            self.misses += 1
+
+        validator = validator_cls(schema)
+        with self._lock:
+            self._validators[key] = validator
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.max_entries:
+                self._validators.popitem(last=False)
+        return validator
+
+    def validator_for_file(
+        self,
+        path: Path,
+        validator_cls: type = jsonschema.Draft202012Validator,
+        parse: Parser = parse_json_bytes,
+    ) -> Any:
+        digest, document = self.load_schema_file(path, parse)
+        return self.validator(document, validator_cls, digest=digest)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+            self._files.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "validators": len(self._validators),
+                "files": len(self._files),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+VALIDATOR_CACHE = ValidatorCache()
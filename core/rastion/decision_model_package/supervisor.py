@@ -0,0 +1,201 @@
+"""Run ``create_model -> solve -> evaluate`` in a supervised child process.
+
+The parent enforces a wall-clock deadline and a resident-memory ceiling and
+kills the child on breach. Memory is the child's peak RSS (``VmHWM``), sampled
+every ``POLL_INTERVAL_SECONDS`` from ``/proc`` and confirmed by the child when
+it finishes; it includes the runner footprint the child inherits at fork. On
+platforms without ``/proc`` the ceiling falls back to ``RLIMIT_AS`` inside the
+child.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+POLL_INTERVAL_SECONDS = 0.02
+# Extra wall-clock time granted on top of a solver.yaml time_limit_seconds, so
+# solvers that honour their own limit are not killed while wrapping up.
+SOLVER_TIME_LIMIT_GRACE_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class RunLimits:
+    timeout_seconds: float | None = None
+    max_memory_bytes: int | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.timeout_seconds is not None or self.max_memory_bytes is not None
+
+    def with_solver_config(self, solver_config: dict) -> "RunLimits":
+        """Tighten the timeout with ``parameters.time_limit_seconds`` from solver.yaml."""
+        parameters = solver_config.get("parameters") if isinstance(solver_config, dict) else None
+        declared = parameters.get("time_limit_seconds") if isinstance(parameters, dict) else None
+        if isinstance(declared, bool) or not isinstance(declared, (int, float)) or declared <= 0:
+            return self
+        solver_timeout = float(declared) + SOLVER_TIME_LIMIT_GRACE_SECONDS
+        if self.timeout_seconds is not None and self.timeout_seconds <= solver_timeout:
+            return self
+        return RunLimits(solver_timeout, self.max_memory_bytes)
+
+
+def _context() -> multiprocessing.context.BaseContext:
+    # fork lets the child reuse the already imported package modules.
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+
+def read_peak_rss(pid: int | str) -> int | None:
+    """Peak resident set size in bytes from /proc, or None if unavailable."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def _child_main(
+    prepared: Any,
+    instance: dict,
+    start_time: float,
+    recorder: Any,
+    max_memory: int | None,
+    conn: Any,
+) -> None:
+    if max_memory is not None and not Path("/proc/self/status").exists():
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+    result = prepared._run_validated(instance, start_time, recorder)
+
+    peak = read_peak_rss("self")
+    if peak is None:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    conn.send((result, peak))
+    conn.close()
+
+
+def _stop(process: multiprocessing.process.BaseProcess) -> None:
+    process.terminate()
+    process.join(1.0)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def memory_limit_result(limits: RunLimits, peak_memory: int, runtime: float, solver_config: dict) -> dict:
+    from .runner import build_error_result
+
+    return build_error_result(
+        [f"DMP_MEMORY_LIMIT_EXCEEDED: peak memory exceeded {limits.max_memory_bytes} bytes"],
+        runtime,
+        solver=solver_config,
+        metadata={
+            "error_type": "DMP_MEMORY_LIMIT_EXCEEDED",
+            "limit_bytes": limits.max_memory_bytes,
+            "peak_memory_bytes": peak_memory,
+        },
+    )
+
+
+def run_supervised(
+    prepared: Any, instance: dict, start_time: float, limits: RunLimits, recorder: Any
+) -> dict:
+    """Execute a validated instance in a child process under ``limits``.
+
+    The child records its phases into a copy of ``recorder``; they come back
+    with its result. On a breach only the parent's phases are reported.
+    """
+    from .runner import build_error_result
+
+    context = _context()
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_child_main,
+        args=(prepared, instance, start_time, recorder, limits.max_memory_bytes, child_conn),
+        daemon=True,
+    )
+    process.start()
+    child_conn.close()
+
+    deadline = None if limits.timeout_seconds is None else time.monotonic() + limits.timeout_seconds
+    peak_memory = 0
+    breach: str | None = None
+    payload = None
+    try:
+        while True:
+            if parent_conn.poll(POLL_INTERVAL_SECONDS):
+                try:
+                    payload = parent_conn.recv()
+                except EOFError:
+                    payload = None
+                break
+            sampled = read_peak_rss(process.pid)
+            if sampled is not None:
+                peak_memory = max(peak_memory, sampled)
+            if limits.max_memory_bytes is not None and peak_memory > limits.max_memory_bytes:
+                breach = "memory"
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                breach = "timeout"
+                break
+            if not process.is_alive() and not parent_conn.poll():
+                break
+    finally:
+        if breach:
+            _stop(process)
+        else:
+            process.join()
+        parent_conn.close()
+
+    runtime = time.perf_counter() - start_time
+    solver_config = prepared.solver_config
+    if breach == "timeout":
+        return build_error_result(
+            [f"DMP_TIMEOUT: run exceeded the wall-clock limit of {limits.timeout_seconds:g}s"],
+            runtime,
+            solver=solver_config,
+            metadata={
+                "error_type": "DMP_TIMEOUT",
+                "limit_seconds": limits.timeout_seconds,
+                "peak_memory_bytes": peak_memory or None,
+            },
+        )
+    if breach == "memory":
+        return memory_limit_result(limits, peak_memory, runtime, solver_config)
+    if payload is None:
+        return build_error_result(
+            ["DMP_WORKER_CRASHED: supervised run terminated unexpectedly"],
+            runtime,
+            solver=solver_config,
+            metadata={
+                "error_type": "DMP_WORKER_CRASHED",
+                "message": f"exit code {process.exitcode}",
+                "peak_memory_bytes": peak_memory or None,
+            },
+        )
+
+    result, child_peak = payload
+    peak_memory = max(peak_memory, child_peak or 0)
+    limit = limits.max_memory_bytes
+    # Breaches between two samples, or a MemoryError under RLIMIT_AS, only
+    # show up once the child has reported back.
+    if limit is not None and (
+        peak_memory > limit or result["metadata"].get("error_type") == "MemoryError"
+    ):
+        return memory_limit_result(limits, peak_memory, runtime, solver_config)
+
+    runner_metadata = result["metadata"].setdefault("runner", {})
+    runner_metadata["supervised"] = True
+    runner_metadata["peak_memory_bytes"] = peak_memory
+    return result
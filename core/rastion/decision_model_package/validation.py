@@ -0,0 +1,307 @@
+"""Single-pass validation engine for Decision Model Package v0.1.
+
+Every required file is read once. Each Python module is parsed into one AST
+that serves all of its function checks. ``solver.yaml`` and
+``instance_schema.json`` are parsed once, and the parsed documents are returned
+with the errors so the runner can reuse them instead of reading the files again.
+
+Errors are :class:`ValidationError` objects with a stable ``code``, a
+human-readable ``message`` and the ``file`` they concern. ``validate_dmp.py``,
+``python -m rastion.decision_model_package.validate_package`` and the runner
+all report these.
+"""
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import jsonschema
+import yaml
+
+from .schema_cache import VALIDATOR_CACHE, parse_yaml_bytes
+
+SCHEMA_DIR = Path(__file__).parent / "schemas"
+INSTANCE_SCHEMA_SPEC = SCHEMA_DIR / "instance_schema.schema.json"
+SOLVER_SCHEMA_SPEC = SCHEMA_DIR / "solver.schema.yaml"
+
+REQUIRED_FILES = (
+    "model.py",
+    "instance_schema.json",
+    "solver.yaml",
+    "evaluate.py",
+    "decision_card.md",
+)
+
+REQUIRED_FUNCTIONS = {
+    "model.py": ("create_model", "solve"),
+    "evaluate.py": ("evaluate", "check_feasibility"),
+}
+
+# Substring of the ``$schema`` URI -> validator class of that dialect.
+SUPPORTED_SCHEMA_DIALECTS = {
+    "draft-07": jsonschema.Draft7Validator,
+    "2020-12": jsonschema.Draft202012Validator,
+}
+
+DECISION_CARD_FIELDS = (
+    "name",
+    "version",
+    "decision_model_package_version",
+    "problem_class",
+    "license",
+    "authors",
+    "tags",
+)
+
+SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.-]+)?$")
+
+# Error codes.
+PACKAGE_NOT_FOUND = "DMP_PACKAGE_NOT_FOUND"
+MISSING_FILE = "DMP_MISSING_FILE"
+UNREADABLE_FILE = "DMP_UNREADABLE_FILE"
+PYTHON_SYNTAX_ERROR = "DMP_PYTHON_SYNTAX_ERROR"
+MISSING_FUNCTION = "DMP_MISSING_FUNCTION"
+INSTANCE_SCHEMA_NOT_JSON = "DMP_INSTANCE_SCHEMA_NOT_JSON"
+INSTANCE_SCHEMA_DIALECT = "DMP_INSTANCE_SCHEMA_DIALECT"
+INSTANCE_SCHEMA_INVALID = "DMP_INSTANCE_SCHEMA_INVALID"
+SOLVER_CONFIG_NOT_YAML = "DMP_SOLVER_CONFIG_NOT_YAML"
+SOLVER_CONFIG_INVALID = "DMP_SOLVER_CONFIG_INVALID"
+DECISION_CARD_FRONT_MATTER = "DMP_DECISION_CARD_FRONT_MATTER"
+DECISION_CARD_INVALID = "DMP_DECISION_CARD_INVALID"
+
+
+@dataclass(frozen=True)
+class ValidationError:
+    code: str
+    message: str
+    file: str | None = None
+
+    def __str__(self) -> str:
+        return self.message
+
+    def as_dict(self) -> dict:
+        return {"code": self.code, "message": self.message, "file": self.file}
+
+
+@dataclass
+class PackageReport:
+    """Validation errors plus the documents parsed while validating."""
+
+    root: Path
+    errors: list[ValidationError] = field(default_factory=list)
+    file_digests: dict[str, str] = field(default_factory=dict)
+    solver_config: Any = None
+    instance_schema: Any = None
+    instance_schema_digest: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def messages(self) -> list[str]:
+        return [error.message for error in self.errors]
+
+    def add(self, code: str, message: str, file: str | None = None) -> None:
+        self.errors.append(ValidationError(code, message, file))
+
+
+def schema_dialect(schema: Any) -> type | None:
+    """Validator class for the dialect declared in ``schema["$schema"]``, if supported."""
+    schema_uri = schema.get("$schema") if isinstance(schema, dict) else None
+    if not isinstance(schema_uri, str):
+        return None
+    for key, validator_cls in SUPPORTED_SCHEMA_DIALECTS.items():
+        if key in schema_uri:
+            return validator_cls
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def meta_schema_validator(validator_cls: type) -> jsonschema.protocols.Validator:
+    """Meta-schema validator of a dialect, built once per process (like check_schema)."""
+    format_checker = getattr(validator_cls, "FORMAT_CHECKER", None)
+    return validator_cls(validator_cls.META_SCHEMA, format_checker=format_checker)
+
+
+def check_functions(report: PackageReport, name: str, source: bytes) -> None:
+    try:
+        tree = ast.parse(source, filename=name)
+    except SyntaxError as exc:
+        report.add(PYTHON_SYNTAX_ERROR, f"Syntax error in {name}: {exc.msg} (line {exc.lineno})", name)
+        return
+    defined = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+    for required in REQUIRED_FUNCTIONS[name]:
+        if required not in defined:
+            report.add(MISSING_FUNCTION, f"{name} must define top-level function: {required}()", name)
+
+
+def check_instance_schema(report: PackageReport, name: str, data: bytes) -> None:
+    try:
+        schema = json.loads(data)
+    except ValueError as exc:
+        report.add(INSTANCE_SCHEMA_NOT_JSON, f"{name} is not valid JSON: {exc}", name)
+        return
+    report.instance_schema = schema
+    report.instance_schema_digest = report.file_digests[name]
+    if not isinstance(schema, dict):
+        report.add(INSTANCE_SCHEMA_INVALID, f"{name} must be a JSON object", name)
+        return
+
+    if not isinstance(schema.get("$schema"), str):
+        report.add(INSTANCE_SCHEMA_DIALECT, f"{name} must declare a $schema string", name)
+    else:
+        validator_cls = schema_dialect(schema)
+        if validator_cls is None:
+            report.add(
+                INSTANCE_SCHEMA_DIALECT,
+                f"{name} declares an unsupported $schema; supported: draft-07, draft 2020-12",
+                name,
+            )
+        else:
+            error = jsonschema.exceptions.best_match(
+                meta_schema_validator(validator_cls).iter_errors(schema)
+            )
+            if error is not None:
+                report.add(
+                    INSTANCE_SCHEMA_INVALID, f"{name} is not valid JSON Schema: {error.message}", name
+                )
+
+    contract = VALIDATOR_CACHE.validator_for_file(
+        INSTANCE_SCHEMA_SPEC, jsonschema.Draft202012Validator
+    )
+    for error in sorted(contract.iter_errors(schema), key=lambda err: err.path):
+        report.add(INSTANCE_SCHEMA_INVALID, f"{name}: {error.message}", name)
+
+
+def check_solver_config(report: PackageReport, name: str, data: bytes) -> None:
+    try:
+        solver_config = yaml.safe_load(data)
+    except yaml.YAMLError as exc:
+        report.add(SOLVER_CONFIG_NOT_YAML, f"{name} is invalid YAML: {exc}", name)
+        return
+    report.solver_config = solver_config
+    contract = VALIDATOR_CACHE.validator_for_file(
+        SOLVER_SCHEMA_SPEC, jsonschema.Draft202012Validator, parse=parse_yaml_bytes
+    )
+    for error in sorted(contract.iter_errors(solver_config), key=lambda err: err.path):
+        report.add(SOLVER_CONFIG_INVALID, f"{name}: {error.message}", name)
+
+
+def parse_front_matter(content: str) -> tuple[Any, str | None]:
+    lines = content.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return None, "decision_card.md must start with YAML front matter (---)"
+
+    end_index = None
+    for index, line in enumerate(lines[1:], start=1):
+        if line.strip() in {"---", "..."}:
+            end_index = index
+            break
+
+    if end_index is None:
+        return None, "decision_card.md front matter is not terminated with ---"
+
+    try:
+        data = yaml.safe_load("\n".join(lines[1:end_index]))
+    except yaml.YAMLError as exc:
+        return None, f"decision_card.md front matter is invalid YAML: {exc}"
+
+    return data, None
+
+
+def check_decision_card(report: PackageReport, name: str, data: bytes) -> None:
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        report.add(UNREADABLE_FILE, f"Failed to read {name}: {exc}", name)
+        return
+
+    front_matter, error = parse_front_matter(content)
+    if error:
+        report.add(DECISION_CARD_FRONT_MATTER, error, name)
+        return
+    if not isinstance(front_matter, dict):
+        report.add(DECISION_CARD_FRONT_MATTER, f"{name} front matter must be a YAML mapping", name)
+        return
+
+    def invalid(message: str) -> None:
+        report.add(DECISION_CARD_INVALID, message, name)
+
+    for required in DECISION_CARD_FIELDS:
+        if required not in front_matter:
+            invalid(f"{name} front matter missing required field: {required}")
+
+    dmp_version = front_matter.get("decision_model_package_version")
+    if dmp_version is not None and dmp_version != "0.1":
+        invalid("decision_model_package_version must be '0.1'")
+
+    version = front_matter.get("version")
+    if version is not None and (not isinstance(version, str) or not SEMVER_PATTERN.match(version)):
+        invalid("version must be a SemVer-like string (e.g. 1.2.3 or 1.2.3-alpha)")
+
+    authors = front_matter.get("authors")
+    if authors is not None:
+        if not isinstance(authors, list) or not authors:
+            invalid("authors must be a non-empty list")
+        else:
+            for index, author in enumerate(authors, start=1):
+                if not isinstance(author, dict):
+                    invalid(f"authors[{index}] must be a mapping")
+                    continue
+                author_name = author.get("name")
+                if not isinstance(author_name, str) or not author_name.strip():
+                    invalid(f"authors[{index}].name must be a non-empty string")
+
+    tags = front_matter.get("tags")
+    if tags is not None:
+        if not isinstance(tags, list) or not tags:
+            invalid("tags must be a non-empty list of strings")
+        else:
+            for index, tag in enumerate(tags, start=1):
+                if not isinstance(tag, str) or not tag.strip():
+                    invalid(f"tags[{index}] must be a non-empty string")
+
+
+CHECKS = {
+    "model.py": check_functions,
+    "evaluate.py": check_functions,
+    "instance_schema.json": check_instance_schema,
+    "solver.yaml": check_solver_config,
+    "decision_card.md": check_decision_card,
+}
+
+
+def validate(package_root: Path) -> PackageReport:
+    """Validate a package against the DMP v0.1 package rules in one pass."""
+    root = Path(package_root)
+    report = PackageReport(root)
+    if not root.exists():
+        report.add(PACKAGE_NOT_FOUND, f"Package root does not exist: {root}")
+        return report
+    if not root.is_dir():
+        report.add(PACKAGE_NOT_FOUND, f"Package root is not a directory: {root}")
+        return report
+
+    contents: dict[str, bytes] = {}
+    for name in REQUIRED_FILES:
+        path = root / name
+        if not path.exists():
+            report.add(MISSING_FILE, f"Missing required file: {name}", name)
+            continue
+        try:
+            contents[name] = path.read_bytes()
+        except OSError as exc:
+            report.add(UNREADABLE_FILE, f"Failed to read {name}: {exc}", name)
+            continue
+        report.file_digests[name] = hashlib.sha256(contents[name]).hexdigest()
+
+    for name, data in contents.items():
+        CHECKS[name](report, name, data)
+    return report
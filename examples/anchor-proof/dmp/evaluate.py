@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 
-def check_feasibility(solution: dict, instance: dict) -> dict:
-    items_by_id = {item["id"]: item for item in instance["items"]}
+def index_items(instance: dict) -> dict:
+    return {item["id"]: item for item in instance["items"]}
+
+
+def check_feasibility(solution: dict, instance: dict, items_by_id: dict | None = None) -> dict:
+    if items_by_id is None:
+        items_by_id = index_items(instance)
     selected_ids = solution.get("selected_item_ids", [])
 
     violations: list[str] = []
@@ -34,8 +39,8 @@ def evaluate(
     instance: dict,
     runtime: float | None = None,
 ) -> dict:
-    feasibility = check_feasibility(solution, instance)
-    items_by_id = {item["id"]: item for item in instance["items"]}
+    items_by_id = index_items(instance)
+    feasibility = check_feasibility(solution, instance, items_by_id)
     total_value = sum(
         items_by_id[item_id]["value"]
         for item_id in solution.get("selected_item_ids", [])
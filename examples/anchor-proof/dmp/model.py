@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import math
+import time
+from bisect import bisect_right
 from typing import Any
 
+MODES = ("greedy", "exact")
+DEFAULT_NODE_LIMIT = 1_000_000
+# Check the time budget once every this many nodes.
+DEADLINE_CHECK_INTERVAL = 1024
+
 
 def create_model(instance: dict, solver_config: dict | None = None) -> dict:
     return {
@@ -10,27 +18,130 @@ def create_model(instance: dict, solver_config: dict | None = None) -> dict:
     }
 
 
-def solve(model: dict, instance: dict | None = None, solver_config: dict | None = None) -> dict:
-    items = model["items"]
-    capacity = model["capacity"]
-
+def _ratio_order(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
     def sort_key(item: dict[str, Any]) -> tuple[float, str]:
         return (-item["value"] / item["weight"], item["id"])
 
-    selected_ids: list[str] = []
+    return sorted(items, key=sort_key)
+
+
+def greedy(items: list[dict[str, Any]], capacity: float) -> list[bool]:
+    """Take items by decreasing value/weight ratio while they fit."""
+    taken: list[bool] = []
     total_weight = 0.0
-    total_value = 0.0
+    for item in items:
+        fits = total_weight + item["weight"] <= capacity
+        taken.append(fits)
+        if fits:
+            total_weight += item["weight"]
+    return taken
+
+
+def branch_and_bound(
+    items: list[dict[str, Any]],
+    capacity: float,
+    incumbent: list[bool],
+    node_limit: int,
+    deadline: float | None,
+) -> tuple[list[bool], float, int, bool]:
+    """Depth-first branch and bound over items sorted by value/weight ratio.
+
+    Each node's bound is the fractional (Dantzig) relaxation of the remaining
+    items, found in O(log n) by bisecting prefix sums of the sorted weights.
+    Returns the best selection, an upper bound on the optimum, the number of
+    nodes explored and whether the search finished.
+    """
+    weights = [item["weight"] for item in items]
+    values = [item["value"] for item in items]
+    count = len(items)
+    prefix_weight = [0.0] * (count + 1)
+    prefix_value = [0.0] * (count + 1)
+    for index in range(count):
+        prefix_weight[index + 1] = prefix_weight[index] + weights[index]
+        prefix_value[index + 1] = prefix_value[index] + values[index]
+    # With integral values the optimum is integral, so bounds can be floored.
+    integral = all(float(value).is_integer() for value in values)
 
-    for item in sorted(items, key=sort_key):
-        if total_weight + item["weight"] <= capacity:
+    def bound(level: int, remaining: float, value: float) -> float:
+        # Items level..stop-1 fit whole; item stop (if any) fits fractionally.
+        stop = bisect_right(prefix_weight, prefix_weight[level] + remaining, lo=level) - 1
+        relaxed = value + prefix_value[stop] - prefix_value[level]
+        if stop < count:
+            leftover = remaining - (prefix_weight[stop] - prefix_weight[level])
+            relaxed += leftover * values[stop] / weights[stop]
+        return math.floor(relaxed + 1e-9) if integral else relaxed
+
+    best = list(incumbent)
+    best_value = sum(value for value, take in zip(values, incumbent) if take)
+    path = [False] * count
+    # (level, remaining capacity, value, whether item level-1 was taken)
+    stack: list[tuple[int, float, float, bool]] = [(0, capacity, 0.0, False)]
+    nodes = 0
+    while stack:
+        if nodes >= node_limit or (
+            deadline is not None
+            and nodes % DEADLINE_CHECK_INTERVAL == 0
+            and time.monotonic() >= deadline
+        ):
+            break
+        level, remaining, value, taken = stack.pop()
+        nodes += 1
+        if level:
+            path[level - 1] = taken
+        if value > best_value:
+            best_value = value
+            best = path[:level] + [False] * (count - level)
+        if level == count or bound(level, remaining, value) <= best_value:
+            continue
+        stack.append((level + 1, remaining, value, False))
+        if weights[level] <= remaining:
+            stack.append((level + 1, remaining - weights[level], value + values[level], True))
+
+    upper_bound = max(
+        [best_value] + [bound(level, remaining, value) for level, remaining, value, _ in stack]
+    )
+    return best, float(upper_bound), nodes, not stack
+
+
+def solve(model: dict, instance: dict | None = None, solver_config: dict | None = None) -> dict:
+    parameters = (solver_config or {}).get("parameters") or {}
+    mode = str(parameters.get("mode", "greedy")).lower()
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode!r} (expected one of {', '.join(MODES)})")
+
+    items = _ratio_order(model["items"])
+    capacity = model["capacity"]
+    taken = greedy(items, capacity)
+    upper_bound = nodes = finished = None
+    if mode == "exact":
+        node_limit = int(parameters.get("node_limit", DEFAULT_NODE_LIMIT))
+        budget = parameters.get("time_budget_seconds")
+        deadline = None if budget is None else time.monotonic() + float(budget)
+        taken, upper_bound, nodes, finished = branch_and_bound(
+            items, capacity, taken, node_limit, deadline
+        )
+
+    selected_ids: list[str] = []
+    total_value = 0.0
+    for item, take in zip(items, taken):
+        if take:
             selected_ids.append(item["id"])
-            total_weight += item["weight"]
             total_value += item["value"]
 
-    return {
-        "status": "feasible",
+    result = {
+        "status": "optimal" if finished else "feasible",
         "objective": total_value,
         "solution": {
             "selected_item_ids": selected_ids,
         },
     }
+    if mode == "exact":
+        if finished:
+            upper_bound = total_value
+        result["metrics"] = {
+            "mode": mode,
+            "nodes": nodes,
+            "upper_bound": upper_bound,
+            "gap": (upper_bound - total_value) / upper_bound if upper_bound > 0 else 0.0,
+        }
+    return result
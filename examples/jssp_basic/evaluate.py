@@ -1,10 +1,43 @@
-"""Evaluate Job-Shop Scheduling solutions."""
+"""Evaluate Job-Shop Scheduling solutions.
+
+With NumPy available, operations are packed into columns (job, operation,
+machine, start, end, duration) and precedence and machine overlaps are checked
+vectorized after a single lexsort by (machine, start). Without NumPy the
+equivalent per-operation loop is used. Both report the same violation messages
+in the same order; at most ``max_violations`` of them are returned.
+"""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+# Keeps result JSON small for badly infeasible schedules; None reports all.
+MAX_VIOLATIONS = 1000
+
+# Order of the per-operation checks within one operation.
+UNKNOWN_MACHINE, MACHINE_MISMATCH, DURATION_MISMATCH, INVALID_TIMING, TIMING_MISMATCH, JOB_ORDER = range(6)
+OPERATION_MESSAGES = (
+    "uses unknown machine",
+    "machine mismatch",
+    "duration mismatch",
+    "has invalid timing",
+    "timing does not match duration",
+    "violates job order",
+)
+
 
+def cap_violations(violations: List[str], total: int, max_violations: Optional[int]) -> List[str]:
+    if max_violations is None or total <= max_violations:
+        return violations
+    omitted = total - max_violations
+    return violations[:max_violations] + [f"{omitted} more violations omitted"]
 
-def check_feasibility(solution: Dict[str, Any], instance: Dict[str, Any]) -> Tuple[bool, List[str]]:
+
+def check_feasibility_python(solution: Dict[str, Any], instance: Dict[str, Any]) -> Tuple[bool, List[str]]:
     violations: list[str] = []
 
     routes = solution.get("routes")
@@ -83,10 +116,145 @@ def check_feasibility(solution: Dict[str, Any], instance: Dict[str, Any]) -> Tup
     return len(violations) == 0, violations
 
 
+def _as_number(value: Any) -> float:
+    return float(value) if isinstance(value, (int, float)) else float("nan")
+
+
+def _group_running_max(values: "np.ndarray", group_starts: "np.ndarray") -> "np.ndarray":
+    """Maximum of the preceding values within each group, 0 before the first."""
+    previous = np.zeros(len(values))
+    bounds = list(group_starts) + [len(values)]
+    for start, stop in zip(bounds, bounds[1:]):
+        if stop - start > 1:
+            previous[start + 1 : stop] = np.maximum.accumulate(np.maximum(values[start : stop - 1], 0))
+    return previous
+
+
+def check_feasibility_numpy(
+    solution: Dict[str, Any], instance: Dict[str, Any], max_violations: Optional[int] = MAX_VIOLATIONS
+) -> Tuple[bool, List[str]]:
+    routes = solution.get("routes")
+    if not isinstance(routes, list):
+        return False, ["Missing or invalid routes list"]
+
+    jobs = instance["jobs"]
+    machines = instance["machines"]
+    machine_ids: dict[str, int] = {}
+    for machine in machines:
+        machine_ids.setdefault(machine, len(machine_ids))
+    machine_names = list(machine_ids)
+
+    head: list[str] = []
+    if len(routes) != len(jobs):
+        head.append("Route count does not match job count")
+
+    # One row per operation the loop evaluator would visit, in job-major order.
+    job_column: list[int] = []
+    op_column: list[int] = []
+    machine_column: list[int] = []
+    expected_machine_column: list[int] = []
+    start_column: list[float] = []
+    end_column: list[float] = []
+    duration_column: list[float] = []
+    expected_duration_column: list[float] = []
+    count_mismatch_rows: list[tuple[int, int]] = []
+
+    for job_index, job in enumerate(jobs):
+        expected_ops = job["operations"]
+        job_route = routes[job_index] if job_index < len(routes) else []
+        if len(job_route) != len(expected_ops):
+            count_mismatch_rows.append((len(job_column), job_index))
+
+        for op_index, expected in enumerate(expected_ops[: len(job_route)]):
+            operation = job_route[op_index]
+            machine = operation.get("machine")
+            job_column.append(job_index)
+            op_column.append(op_index)
+            machine_column.append(machine_ids.get(machine, -1) if isinstance(machine, str) else -1)
+            expected_machine_column.append(machine_ids.get(expected["machine"], -2))
+            start_column.append(_as_number(operation.get("start")))
+            end_column.append(_as_number(operation.get("end")))
+            duration_column.append(_as_number(operation.get("duration")))
+            expected_duration_column.append(expected["duration"])
+
+    job_ids = np.array(job_column, dtype=np.int64)
+    machine_id = np.array(machine_column, dtype=np.int64)
+    start = np.array(start_column, dtype=float)
+    end = np.array(end_column, dtype=float)
+    expected_duration = np.array(expected_duration_column, dtype=float)
+
+    known = machine_id >= 0
+    timed = known & ~np.isnan(start) & ~np.isnan(end)
+    checks = {
+        UNKNOWN_MACHINE: ~known,
+        MACHINE_MISMATCH: known & (machine_id != np.array(expected_machine_column, dtype=np.int64)),
+        DURATION_MISMATCH: known & (np.array(duration_column, dtype=float) != expected_duration),
+        INVALID_TIMING: known & ~timed,
+        TIMING_MISMATCH: timed & (end - start != expected_duration),
+    }
+
+    # Precedence: start before the latest end of earlier timed operations of the job.
+    timed_rows = np.flatnonzero(timed)
+    if len(timed_rows):
+        timed_jobs = job_ids[timed_rows]
+        job_starts = np.flatnonzero(np.r_[True, timed_jobs[1:] != timed_jobs[:-1]])
+        previous_end = _group_running_max(end[timed_rows], job_starts)
+        late = np.zeros(len(start), dtype=bool)
+        late[timed_rows] = start[timed_rows] < previous_end
+        checks[JOB_ORDER] = late
+
+    # Each operation row contributes its checks in order (key = row * 8 + check);
+    # a job's count mismatch precedes its first row.
+    keys = np.sort(np.concatenate([np.flatnonzero(mask) * 8 + check for check, mask in checks.items()]))
+
+    # Machine overlaps: one stable lexsort by (machine, start) over timed rows.
+    overlap_rows = np.empty(0, dtype=np.int64)
+    if len(timed_rows):
+        order = timed_rows[np.lexsort((start[timed_rows], machine_id[timed_rows]))]
+        sorted_machines = machine_id[order]
+        machine_starts = np.flatnonzero(np.r_[True, sorted_machines[1:] != sorted_machines[:-1]])
+        busy_until = _group_running_max(end[order], machine_starts)
+        overlap_rows = order[start[order] < busy_until]
+
+    total = len(head) + len(count_mismatch_rows) + len(keys) + len(overlap_rows)
+    limit = total if max_violations is None else max_violations
+    violations = head[:limit]
+    pending_jobs = iter(count_mismatch_rows)
+    next_job = next(pending_jobs, None)
+    for key in keys[: max(limit - len(violations), 0)].tolist():
+        row, check = divmod(key, 8)
+        while next_job is not None and next_job[0] <= row:
+            violations.append(f"Job {next_job[1]} operation count mismatch")
+            next_job = next(pending_jobs, None)
+        violations.append(f"Job {job_column[row]} operation {op_column[row]} {OPERATION_MESSAGES[check]}")
+    while next_job is not None:
+        violations.append(f"Job {next_job[1]} operation count mismatch")
+        next_job = next(pending_jobs, None)
+    violations = violations[:limit]
+    for row in overlap_rows[: max(limit - len(violations), 0)].tolist():
+        violations.append(
+            f"Machine {machine_names[machine_column[row]]} has overlapping operations at job {job_column[row]}"
+        )
+
+    return total == 0, cap_violations(violations, total, max_violations)
+
+
+def check_feasibility(
+    solution: Dict[str, Any], instance: Dict[str, Any], max_violations: Optional[int] = MAX_VIOLATIONS
+) -> Tuple[bool, List[str]]:
+    if np is not None:
+        return check_feasibility_numpy(solution, instance, max_violations)
+    feasible, violations = check_feasibility_python(solution, instance)
+    return feasible, cap_violations(violations, len(violations), max_violations)
+
+
 def evaluate(
-    solution: Dict[str, Any], instance: Dict[str, Any], runtime: float | None = None
+    solution: Dict[str, Any],
+    instance: Dict[str, Any],
+    runtime: float | None = None,
+    max_violations: Optional[int] = MAX_VIOLATIONS,
 ) -> Dict[str, Any]:
-    feasible, violations = check_feasibility(solution, instance)
+    feasible, violations = check_feasibility(solution, instance, max_violations)
     objective = None
 
     if feasible:
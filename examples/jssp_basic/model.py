@@ -1,62 +1,259 @@
-"""Job-Shop Scheduling greedy baseline."""
+"""Job-Shop Scheduling dispatching-rule solver.
+
+Schedules are built with the Giffler-Thompson active-schedule generator: the
+operation with the earliest completion time fixes a machine and a conflict set
+of operations that could start on it before that time; a priority rule picks
+one of them. Ready operations sit in a heap keyed on earliest completion time
+(stale keys are refreshed lazily) and each machine keeps a heap of its waiting
+jobs by release time, so a schedule takes O(ops log ops) plus the conflict sets.
+
+``solver.yaml`` ``parameters``:
+
+- ``rule``: ``mwkr`` (most work remaining, default), ``spt``, ``lpt`` or ``random``.
+- ``restarts``: extra runs of the rule with randomly perturbed priorities,
+  keeping the best schedule (default 0).
+- ``workers``: processes sharing the restarts (default 1).
+- ``time_budget_seconds``: no new restart starts after this budget.
+- ``seed``: base seed of the randomized runs (default 0).
+"""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple
+import heapq
+import multiprocessing
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+RULES = ("spt", "lpt", "mwkr", "random")
+# Relative perturbation of the rule value in randomized restarts.
+RESTART_NOISE = 0.3
+
+# (makespan, per-job start times, seed or None for the deterministic run)
+Schedule = Tuple[float, List[List[float]], Optional[int]]
 
 
 def create_model(instance: Dict[str, Any], solver_config: Optional[Dict[str, Any]] = None) -> Any:
-    """Create and return solver-specific model artifacts."""
+    """Index operations by job: machines, durations and remaining work."""
+    durations: list[list[int]] = []
+    machines: list[list[str]] = []
+    remaining: list[list[int]] = []
+    for job in instance["jobs"]:
+        job_durations = [operation["duration"] for operation in job["operations"]]
+        durations.append(job_durations)
+        machines.append([operation["machine"] for operation in job["operations"]])
+        suffix = 0
+        job_remaining = [0] * len(job_durations)
+        for op_index in range(len(job_durations) - 1, -1, -1):
+            suffix += job_durations[op_index]
+            job_remaining[op_index] = suffix
+        remaining.append(job_remaining)
+
     return {
         "instance": instance,
+        "durations": durations,
+        "machines": machines,
+        "remaining": remaining,
         "solver": solver_config or {},
     }
 
 
-def _build_greedy_schedule(instance: Dict[str, Any]) -> Tuple[list[list[dict]], float]:
-    machines = instance["machines"]
-    jobs = instance["jobs"]
+def _priority(
+    model: Dict[str, Any], rule: str, rng: random.Random, noise: float = 0.0
+) -> Callable[[int, int], Any]:
+    """Sort key of operation ``(job, op_index)``; the smallest key is dispatched.
 
-    machine_available = {machine: 0 for machine in machines}
-    job_available = [0 for _ in jobs]
-    routes: list[list[dict]] = []
+    With ``noise``, the rule value is scaled by a random factor in
+    ``[1 - noise, 1]`` so restarts explore near-greedy schedules.
+    """
+    durations = model["durations"]
+    remaining = model["remaining"]
+    if rule == "random":
+        return lambda job, op_index: (rng.random(), job)
+    if rule == "spt":
+        value = lambda job, op_index: durations[job][op_index]
+    elif rule == "lpt":
+        value = lambda job, op_index: -durations[job][op_index]
+    elif rule == "mwkr":
+        value = lambda job, op_index: -remaining[job][op_index]
+    else:
+        raise ValueError(f"Unknown dispatching rule: {rule!r} (expected one of {', '.join(RULES)})")
+    if not noise:
+        return lambda job, op_index: (value(job, op_index), job)
+    return lambda job, op_index: (value(job, op_index) * rng.uniform(1.0 - noise, 1.0), job)
+
+
+def giffler_thompson(
+    model: Dict[str, Any], rule: str, seed: Optional[int] = None, noise: float = 0.0
+) -> Schedule:
+    """Build one active schedule; returns its makespan and start times."""
+    durations = model["durations"]
+    machines = model["machines"]
+    priority = _priority(model, rule, random.Random(seed), noise)
+
+    job_count = len(durations)
+    next_op = [0] * job_count
+    job_ready = [0] * job_count
+    machine_ready: dict[str, float] = {}
+    waiting: dict[str, list[tuple[float, int]]] = {}
+    frontier: list[tuple[float, int, int]] = []
+    starts: list[list[float]] = [[0] * len(job_durations) for job_durations in durations]
+
+    for job in range(job_count):
+        if durations[job]:
+            heapq.heappush(waiting.setdefault(machines[job][0], []), (0, job))
+            heapq.heappush(frontier, (durations[job][0], job, 0))
+
+    makespan = 0
+    while frontier:
+        completion, job, op_index = heapq.heappop(frontier)
+        if op_index != next_op[job]:
+            # The job was dispatched from another operation's conflict set.
+            continue
+        machine = machines[job][op_index]
+        current = max(job_ready[job], machine_ready.get(machine, 0)) + durations[job][op_index]
+        if current != completion:
+            heapq.heappush(frontier, (current, job, op_index))
+            continue
+
+        # Conflict set: jobs waiting for this machine that are released before
+        # the earliest completion time.
+        queue = waiting[machine]
+        conflict = []
+        while queue and queue[0][0] < completion:
+            conflict.append(heapq.heappop(queue))
+        chosen = min(conflict, key=lambda entry: priority(entry[1], next_op[entry[1]]))
+        for entry in conflict:
+            if entry is not chosen:
+                heapq.heappush(queue, entry)
+
+        chosen_job = chosen[1]
+        chosen_op = next_op[chosen_job]
+        start = max(job_ready[chosen_job], machine_ready.get(machine, 0))
+        end = start + durations[chosen_job][chosen_op]
+        starts[chosen_job][chosen_op] = start
+        job_ready[chosen_job] = end
+        machine_ready[machine] = end
+        next_op[chosen_job] = chosen_op + 1
+        makespan = max(makespan, end)
+
+        if chosen_job != job:
+            heapq.heappush(frontier, (completion, job, op_index))
+        if chosen_op + 1 < len(durations[chosen_job]):
+            next_machine = machines[chosen_job][chosen_op + 1]
+            heapq.heappush(waiting.setdefault(next_machine, []), (end, chosen_job))
+            next_completion = max(end, machine_ready.get(next_machine, 0)) + durations[chosen_job][chosen_op + 1]
+            heapq.heappush(frontier, (next_completion, chosen_job, chosen_op + 1))
+
+    return float(makespan), starts, seed
+
+
+def _best_of_restarts(
+    model: Dict[str, Any], rule: str, seeds: List[int], deadline: Optional[float]
+) -> Tuple[Optional[Schedule], int]:
+    best: Optional[Schedule] = None
+    completed = 0
+    for seed in seeds:
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        schedule = giffler_thompson(model, rule, seed, RESTART_NOISE)
+        completed += 1
+        if best is None or schedule[0] < best[0]:
+            best = schedule
+    return best, completed
 
-    for job_index, job in enumerate(jobs):
-        job_route: list[dict] = []
-        for op_index, operation in enumerate(job["operations"]):
-            machine = operation["machine"]
-            duration = operation["duration"]
 
-            start_time = max(job_available[job_index], machine_available[machine])
-            end_time = start_time + duration
+def _restart_worker(
+    model: Dict[str, Any], rule: str, seeds: List[int], deadline: Optional[float], conn: Any
+) -> None:
+    conn.send(_best_of_restarts(model, rule, seeds, deadline))
+    conn.close()
 
+
+def run_restarts(
+    model: Dict[str, Any], rule: str, seeds: List[int], workers: int, deadline: Optional[float]
+) -> Tuple[Optional[Schedule], int]:
+    """Run randomized restarts of ``rule``, striped over ``workers`` forked processes."""
+    parallel = (
+        workers > 1
+        and len(seeds) > 1
+        and "fork" in multiprocessing.get_all_start_methods()
+        # Daemonic processes (e.g. a supervised run) cannot have children.
+        and not multiprocessing.current_process().daemon
+    )
+    if not parallel:
+        return _best_of_restarts(model, rule, seeds, deadline)
+
+    context = multiprocessing.get_context("fork")
+    processes = []
+    for stripe in range(min(workers, len(seeds))):
+        parent_conn, child_conn = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_restart_worker, args=(model, rule, seeds[stripe::workers], deadline, child_conn)
+        )
+        process.start()
+        child_conn.close()
+        processes.append((process, parent_conn))
+
+    best: Optional[Schedule] = None
+    completed = 0
+    for process, conn in processes:
+        try:
+            schedule, count = conn.recv()
+        except EOFError:
+            schedule, count = None, 0
+        process.join()
+        completed += count
+        if schedule is not None and (best is None or (schedule[0], schedule[2]) < (best[0], best[2])):
+            best = schedule
+    return best, completed
+
+
+def solve(
+    model: Any, instance: Dict[str, Any], solver_config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Solve the JSSP instance with Giffler-Thompson dispatching and optional restarts."""
+    parameters = (solver_config or {}).get("parameters") or {}
+    rule = str(parameters.get("rule", "mwkr")).lower()
+    restarts = int(parameters.get("restarts", 0))
+    workers = int(parameters.get("workers", 1))
+    seed = int(parameters.get("seed", 0))
+    budget = parameters.get("time_budget_seconds")
+    deadline = None if budget is None else time.monotonic() + float(budget)
+
+    best = giffler_thompson(model, rule, seed if rule == "random" else None)
+    completed = 0
+    if restarts > 0:
+        seeds = list(range(seed + 1, seed + 1 + restarts))
+        restart_best, completed = run_restarts(model, rule, seeds, workers, deadline)
+        if restart_best is not None and restart_best[0] < best[0]:
+            best = restart_best
+    makespan, starts, best_seed = best
+
+    routes: list[list[dict]] = []
+    for job_index, job in enumerate(instance["jobs"]):
+        job_route: list[dict] = []
+        for op_index, operation in enumerate(job["operations"]):
+            start_time = starts[job_index][op_index]
             job_route.append(
                 {
                     "job": job_index,
                     "operation": op_index,
-                    "machine": machine,
+                    "machine": operation["machine"],
                     "start": start_time,
-                    "end": end_time,
-                    "duration": duration,
+                    "end": start_time + operation["duration"],
+                    "duration": operation["duration"],
                 }
             )
-
-            job_available[job_index] = end_time
-            machine_available[machine] = end_time
         routes.append(job_route)
 
-    makespan = float(max(job_available)) if job_available else 0.0
-    return routes, makespan
-
-
-def solve(
-    model: Any, instance: Dict[str, Any], solver_config: Optional[Dict[str, Any]] = None
-) -> Dict[str, Any]:
-    """Solve the JSSP instance via greedy list scheduling."""
-    routes, makespan = _build_greedy_schedule(instance)
     return {
         "status": "feasible",
         "solution": {"routes": routes},
         "objective": makespan,
-        "metrics": {},
+        "metrics": {
+            "rule": rule,
+            "restarts_completed": completed,
+            "best_seed": best_seed,
+        },
         "runtime_seconds": 0.0,
     }
@@ -1,7 +1,25 @@
-"""Knapsack Dynamic Programming baseline."""
+"""Knapsack Dynamic Programming baseline.
+
+The DP keeps a single rolling row of best values and stores, per item, one
+take/skip bit per state for reconstruction. With NumPy available each row update
+is vectorized and the decision bits are packed eight to a byte; otherwise a
+pure-Python loop with one byte per state is used.
+
+The DP runs over capacities ``0..capacity`` unless the total value is smaller
+than the capacity, in which case it runs over values ``0..sum(values)`` and
+tracks the minimum weight reaching each value instead.
+"""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+# Keep NumPy rows in int64 well clear of overflow.
+INT64_SAFE_LIMIT = 2**62
 
 
 def create_model(instance: Dict[str, Any], solver_config: Optional[Dict[str, Any]] = None) -> Any:
@@ -12,6 +30,102 @@ def create_model(instance: Dict[str, Any], solver_config: Optional[Dict[str, Any
     }
 
 
+def capacity_dp_numpy(weights: List[int], values: List[int], capacity: int) -> List[int]:
+    best = np.zeros(capacity + 1, dtype=np.int64)
+    decisions: list[Any] = []
+    for weight, value in zip(weights, values):
+        if weight > capacity:
+            decisions.append(None)
+            continue
+        take = best[: capacity + 1 - weight] + value
+        taken = take > best[weight:]
+        best[weight:] = np.where(taken, take, best[weight:])
+        decisions.append(np.packbits(taken))
+
+    selected_items: list[int] = []
+    remaining_capacity = capacity
+    for i in range(len(weights) - 1, -1, -1):
+        packed = decisions[i]
+        offset = remaining_capacity - weights[i]
+        if packed is not None and offset >= 0 and packed[offset >> 3] >> (7 - (offset & 7)) & 1:
+            selected_items.append(i)
+            remaining_capacity = offset
+    return selected_items
+
+
+def capacity_dp_python(weights: List[int], values: List[int], capacity: int) -> List[int]:
+    best = [0] * (capacity + 1)
+    decisions: list[Any] = []
+    for weight, value in zip(weights, values):
+        if weight > capacity:
+            decisions.append(None)
+            continue
+        taken = bytearray(capacity + 1 - weight)
+        for cap in range(capacity, weight - 1, -1):
+            take = best[cap - weight] + value
+            if take > best[cap]:
+                best[cap] = take
+                taken[cap - weight] = 1
+        decisions.append(taken)
+
+    selected_items: list[int] = []
+    remaining_capacity = capacity
+    for i in range(len(weights) - 1, -1, -1):
+        taken = decisions[i]
+        offset = remaining_capacity - weights[i]
+        if taken is not None and offset >= 0 and taken[offset]:
+            selected_items.append(i)
+            remaining_capacity = offset
+    return selected_items
+
+
+def value_dp_numpy(weights: List[int], values: List[int], capacity: int) -> List[int]:
+    total_value = sum(values)
+    unreachable = sum(weights) + 1
+    lightest = np.full(total_value + 1, unreachable, dtype=np.int64)
+    lightest[0] = 0
+    decisions: list[Any] = []
+    for weight, value in zip(weights, values):
+        candidate = lightest[: total_value + 1 - value] + weight
+        taken = candidate < lightest[value:]
+        lightest[value:] = np.where(taken, candidate, lightest[value:])
+        decisions.append(np.packbits(taken))
+
+    remaining_value = int(np.flatnonzero(lightest <= capacity)[-1])
+    selected_items: list[int] = []
+    for i in range(len(weights) - 1, -1, -1):
+        offset = remaining_value - values[i]
+        if offset >= 0 and decisions[i][offset >> 3] >> (7 - (offset & 7)) & 1:
+            selected_items.append(i)
+            remaining_value = offset
+    return selected_items
+
+
+def value_dp_python(weights: List[int], values: List[int], capacity: int) -> List[int]:
+    total_value = sum(values)
+    unreachable = sum(weights) + 1
+    lightest = [unreachable] * (total_value + 1)
+    lightest[0] = 0
+    decisions: list[bytearray] = []
+    for weight, value in zip(weights, values):
+        taken = bytearray(total_value + 1 - value)
+        for reached in range(total_value, value - 1, -1):
+            candidate = lightest[reached - value] + weight
+            if candidate < lightest[reached]:
+                lightest[reached] = candidate
+                taken[reached - value] = 1
+        decisions.append(taken)
+
+    remaining_value = max(reached for reached, weight in enumerate(lightest) if weight <= capacity)
+    selected_items: list[int] = []
+    for i in range(len(weights) - 1, -1, -1):
+        offset = remaining_value - values[i]
+        if offset >= 0 and decisions[i][offset]:
+            selected_items.append(i)
+            remaining_value = offset
+    return selected_items
+
+
 def solve(
     model: Any, instance: Dict[str, Any], solver_config: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
@@ -19,28 +133,16 @@ def solve(
     weights = instance["weights"]
     values = instance["values"]
     capacity = instance["capacity"]
-    item_count = len(weights)
-
-    table = [[0 for _ in range(capacity + 1)] for _ in range(item_count + 1)]
 
-    for i in range(1, item_count + 1):
-        weight = weights[i - 1]
-        value = values[i - 1]
-        for cap in range(capacity + 1):
-            if weight <= cap:
-                take = value + table[i - 1][cap - weight]
-                skip = table[i - 1][cap]
-                table[i][cap] = max(take, skip)
-            else:
-                table[i][cap] = table[i - 1][cap]
-
-    selected_items: list[int] = []
-    remaining_capacity = capacity
-    for i in range(item_count, 0, -1):
-        if table[i][remaining_capacity] != table[i - 1][remaining_capacity]:
-            selected_items.append(i - 1)
-            remaining_capacity -= weights[i - 1]
+    total_value = sum(values)
+    dp_axis = "value" if total_value < capacity else "capacity"
+    use_numpy = np is not None and max(total_value, sum(weights) + 1) < INT64_SAFE_LIMIT
+    if dp_axis == "value":
+        engine = value_dp_numpy if use_numpy else value_dp_python
+    else:
+        engine = capacity_dp_numpy if use_numpy else capacity_dp_python
 
+    selected_items = engine(weights, values, capacity)
     selected_items.reverse()
     total_value = sum(values[i] for i in selected_items)
 
@@ -48,6 +150,6 @@ def solve(
         "status": "optimal",
         "solution": {"routes": [selected_items]},
         "objective": float(total_value),
-        "metrics": {},
+        "metrics": {"dp_axis": dp_axis, "backend": "numpy" if use_numpy else "python"},
         "runtime_seconds": 0.0,
     }
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Tuple
 
 def check_feasibility(solution: Dict[str, Any], instance: Dict[str, Any]) -> Tuple[bool, List[str], Dict[str, Any]]:
     violations: list[str] = []
-    universe = set(instance["universe"])
+    universe = instance["universe"]
     available_sets = {set_data["id"]: set_data for set_data in instance["sets"]}
 
     selected_ids = solution.get("selected_set_ids", [])
@@ -14,20 +14,28 @@ def check_feasibility(solution: Dict[str, Any], instance: Dict[str, Any]) -> Tup
     if unknown_ids:
         violations.append("Unknown set ids selected")
 
-    covered_elements: set[str] = set()
     total_cost = 0.0
     for set_id in selected_ids:
         set_data = available_sets.get(set_id)
         if not set_data:
             continue
-        covered_elements |= set(set_data["elements"])
         total_cost += set_data["cost"]
 
-    if not universe.issubset(covered_elements):
+    # Selecting a set twice adds its cost twice but covers nothing new.
+    covered_elements: set[str] = set()
+    for set_id in dict.fromkeys(selected_ids):
+        set_data = available_sets.get(set_id)
+        if set_data:
+            covered_elements.update(set_data["elements"])
+
+    # Universe elements are unique (instance schema), so a single membership
+    # scan counts coverage without materializing a universe-sized set.
+    covered_count = sum(map(covered_elements.__contains__, universe))
+    if covered_count != len(universe):
         violations.append("Not all universe elements are covered")
 
     metrics = {
-        "covered_count": len(covered_elements & universe),
+        "covered_count": covered_count,
         "selected_count": len(selected_ids),
         "total_cost": float(total_cost),
     }
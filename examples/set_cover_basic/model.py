@@ -1,14 +1,29 @@
 """Greedy set cover baseline."""
 from __future__ import annotations
 
+import heapq
 from typing import Any, Dict, List, Optional
 
 
 def create_model(instance: Dict[str, Any], solver_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Pass through instance data for the solver."""
+    """Precompute each set's universe elements and the element -> sets index."""
+    universe = list(instance["universe"])
+    sets = list(instance["sets"])
+    in_universe = set(universe)
+
+    set_elements: List[List[str]] = []
+    element_sets: Dict[str, List[int]] = {element: [] for element in in_universe}
+    for index, set_data in enumerate(sets):
+        elements = [element for element in dict.fromkeys(set_data["elements"]) if element in in_universe]
+        set_elements.append(elements)
+        for element in elements:
+            element_sets[element].append(index)
+
     return {
-        "universe": list(instance["universe"]),
-        "sets": list(instance["sets"]),
+        "universe": universe,
+        "sets": sets,
+        "set_elements": set_elements,
+        "element_sets": element_sets,
         "solver": solver_config or {},
     }
 
@@ -16,41 +31,46 @@ def create_model(instance: Dict[str, Any], solver_config: Optional[Dict[str, Any
 def solve(
     model: Dict[str, Any], instance: Dict[str, Any], solver_config: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
-    """Solve the set cover instance using a deterministic greedy heuristic."""
-    universe = list(instance["universe"])
-    available_sets = list(instance["sets"])
-    uncovered = set(universe)
+    """Solve the set cover instance using a deterministic lazy greedy heuristic.
+
+    Each step picks the set minimizing ``(cost / newly covered, cost, id)``, the
+    earliest listed set winning exact ties. Heap keys are only ever stale
+    towards lower ratios, so a popped entry whose key is still current is the
+    true minimum; stale entries are re-pushed with their current key.
+    """
+    sets = model["sets"]
+    set_elements = model["set_elements"]
+    element_sets = model["element_sets"]
+    uncovered = set(model["universe"])
+    uncovered_counts = [len(elements) for elements in set_elements]
     selected_ids: List[str] = []
 
-    while uncovered:
-        best_choice = None
-        for set_data in available_sets:
-            set_elements = set(set_data["elements"])
-            newly_covered = uncovered & set_elements
-            if not newly_covered:
-                continue
-            ratio = set_data["cost"] / len(newly_covered)
-            candidate = (
-                ratio,
-                set_data["cost"],
-                set_data["id"],
-                set_data,
-            )
-            if best_choice is None or candidate[:3] < best_choice[:3]:
-                best_choice = candidate
-
-        if best_choice is None:
-            break
-
-        chosen_set = best_choice[3]
-        selected_ids.append(chosen_set["id"])
-        uncovered -= set(chosen_set["elements"])
-
-    total_cost = sum(
-        set_data["cost"]
-        for set_data in available_sets
-        if set_data["id"] in set(selected_ids)
-    )
+    heap = [
+        (set_data["cost"] / uncovered_counts[index], set_data["cost"], set_data["id"], index)
+        for index, set_data in enumerate(sets)
+        if uncovered_counts[index]
+    ]
+    heapq.heapify(heap)
+
+    while uncovered and heap:
+        ratio, cost, set_id, index = heapq.heappop(heap)
+        count = uncovered_counts[index]
+        if not count:
+            continue
+        current_ratio = cost / count
+        if current_ratio != ratio:
+            heapq.heappush(heap, (current_ratio, cost, set_id, index))
+            continue
+
+        selected_ids.append(set_id)
+        for element in set_elements[index]:
+            if element in uncovered:
+                uncovered.discard(element)
+                for other in element_sets[element]:
+                    uncovered_counts[other] -= 1
+
+    selected = set(selected_ids)
+    total_cost = sum(set_data["cost"] for set_data in sets if set_data["id"] in selected)
     feasible = not uncovered
 
     return {
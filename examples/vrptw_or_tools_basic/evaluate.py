@@ -1,20 +1,90 @@
-"""Evaluate VRPTW solution quality (mock)."""
+"""Evaluate VRPTW solution quality.
+
+Routes list customer indices without the depot; route ``k`` is served by
+vehicle ``k`` with capacity ``vehicle_capacities[k]``. Each route leaves the
+depot when its time window opens. Travel time equals distance, service times
+are zero, and a vehicle arriving early waits for the window to open. The
+schedule is checked in a single pass, updating service start and slack in O(1)
+per stop.
+"""
 from __future__ import annotations
 
 from typing import Any, Dict, List, Tuple
 
 
-def check_feasibility(solution: Dict[str, Any], instance: Dict[str, Any]) -> Tuple[bool, List[str]]:
-    return True, []
+def check_feasibility(solution: Dict[str, Any], instance: Dict[str, Any]) -> Tuple[bool, List[str], Dict[str, Any]]:
+    violations: list[str] = []
+    routes = solution.get("routes")
+    if not isinstance(routes, list) or not all(isinstance(route, list) for route in routes):
+        return False, ["Missing or invalid routes list"], {}
+
+    distance = instance["distance_matrix"]
+    windows = instance["time_windows"]
+    demands = instance["demands"]
+    capacities = instance["vehicle_capacities"]
+    depot = instance["depot"]
+    node_count = len(distance)
+
+    if len(routes) > min(instance["num_vehicles"], len(capacities)):
+        violations.append("Route count exceeds available vehicles")
+
+    visits = [0] * node_count
+    total_distance = 0
+    min_slack = None
+    for route_index, route in enumerate(routes):
+        if any(not isinstance(node, int) or not 0 <= node < node_count for node in route):
+            violations.append(f"Route {route_index} visits an unknown node")
+            continue
+        if depot in route:
+            violations.append(f"Route {route_index} visits the depot mid-route")
+
+        load = sum(demands[node] for node in route)
+        if route_index < len(capacities) and load > capacities[route_index]:
+            violations.append(f"Route {route_index} exceeds vehicle capacity")
+
+        for node in route:
+            visits[node] += 1
+        if not route:
+            continue
+
+        previous = depot
+        service_start = windows[depot][0]
+        for node in route + [depot]:
+            service_start = max(windows[node][0], service_start + distance[previous][node])
+            slack = windows[node][1] - service_start
+            min_slack = slack if min_slack is None else min(min_slack, slack)
+            total_distance += distance[previous][node]
+            if slack < 0:
+                if node == depot:
+                    violations.append(f"Route {route_index} returns to the depot after its time window")
+                else:
+                    violations.append(f"Route {route_index} reaches customer {node} after its time window")
+            previous = node
+
+    for node in range(node_count):
+        if node == depot:
+            continue
+        if visits[node] == 0:
+            violations.append(f"Customer {node} is not visited")
+        elif visits[node] > 1:
+            violations.append(f"Customer {node} is visited more than once")
+
+    metrics = {
+        "total_distance": float(total_distance),
+        "vehicles_used": sum(1 for route in routes if route),
+        "min_time_slack": min_slack,
+    }
+    return len(violations) == 0, violations, metrics
 
 
 def evaluate(
     solution: Dict[str, Any], instance: Dict[str, Any], runtime: float | None = None
 ) -> Dict[str, Any]:
-    feasible, violations = check_feasibility(solution, instance)
+    feasible, violations, metrics = check_feasibility(solution, instance)
     return {
         "feasible": feasible,
-        "objective": None,
+        "objective": metrics["total_distance"] if feasible else None,
         "runtime": runtime,
         "violations": violations,
+        "metrics": metrics,
     }
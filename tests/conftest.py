@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+try:
+    import rastion  # noqa: F401
+except ImportError:  # running from a source checkout without installing
+    sys.path.insert(0, str(REPO_ROOT / "core"))
+
+# Instances with this value make the worker process exit without a result.
+CRASH_VALUE = -1
+# Instances with at least this value take a while to solve.
+SLOW_VALUE = 100
+
+CRASHING_SOLVE = f'''
+
+import os
+import time
+
+
+def solve(model, instance, solver_config):
+    if model["value"] == {CRASH_VALUE}:
+        os._exit(1)
+    if model["value"] >= {SLOW_VALUE}:
+        time.sleep(0.2)
+    return {{
+        "solution": {{"value": model["value"]}},
+        "status": "feasible",
+        "objective": model["value"],
+    }}
+'''
+
+
+@pytest.fixture
+def package_dir(tmp_path: Path) -> Path:
+    """A copy of ``templates/minimal-dmp`` whose solve() kills its process on ``CRASH_VALUE``."""
+    target = tmp_path / "minimal-dmp"
+    shutil.copytree(REPO_ROOT / "templates" / "minimal-dmp", target)
+    with (target / "model.py").open("a", encoding="utf-8") as stream:
+        stream.write(CRASHING_SOLVE)
+    return target
+
+
+def write_instances(directory: Path, values: list[int]) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index, value in enumerate(values):
+        path = directory / f"instance-{index:02d}.json"
+        path.write_text(json.dumps({"value": value}), encoding="utf-8")
+        paths.append(path)
+    return paths
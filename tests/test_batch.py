@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from conftest import CRASH_VALUE, write_instances
+from rastion.decision_model_package.batch import run_instances, run_stream
+
+
+def test_worker_crash_is_blamed_on_the_crashing_instance_only(package_dir: Path, tmp_path: Path) -> None:
+    paths = write_instances(tmp_path / "instances", [1, 2, CRASH_VALUE, 3, 4])
+    results: dict[Path, dict] = {}
+
+    exit_code = run_instances(package_dir, paths, results.__setitem__, jobs=3)
+
+    assert exit_code == 1
+    crashed = results.pop(paths[2])
+    assert crashed["metadata"]["error_type"] == "DMP_WORKER_CRASHED"
+    assert len(results) == 4
+    for path, result in results.items():
+        assert result["status"] == "feasible", path
+
+
+def test_pool_broken_between_submissions_is_recovered(package_dir: Path) -> None:
+    def slow_records():
+        yield "crash", json.dumps({"value": CRASH_VALUE}).encode("utf-8")
+        for value in (1, 2, 3):
+            # Give the first worker time to die before the next submission.
+            time.sleep(0.5)
+            yield f"healthy-{value}", json.dumps({"value": value}).encode("utf-8")
+
+    results: dict[str, dict] = {}
+
+    exit_code = run_stream(package_dir, slow_records(), results.__setitem__, jobs=2)
+
+    assert exit_code == 1
+    assert results.pop("crash")["metadata"]["error_type"] == "DMP_WORKER_CRASHED"
+    for key, result in results.items():
+        assert result["status"] == "feasible", key
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from rastion import cli
+
+
+@pytest.mark.parametrize(
+    "option",
+    [
+        ["--cache"],
+        ["--timeout", "5"],
+        ["--max-memory", "1G"],
+        ["--fail-fast"],
+        ["--metrics-file", "metrics.prom"],
+        ["--trace-memory"],
+    ],
+)
+def test_via_daemon_rejects_options_the_daemon_ignores(option, monkeypatch, capsys) -> None:
+    argv = ["decisionhub", "run", "pkg", "--instance", "instance.json", "--via-daemon", *option]
+    monkeypatch.setattr(sys, "argv", argv)
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main()
+
+    assert excinfo.value.code == 2
+    assert f"--via-daemon cannot be combined with {option[0]}" in capsys.readouterr().err
+
+
+def test_ndjson_output_directory_is_rejected_on_stderr(package_dir, tmp_path, monkeypatch, capsys) -> None:
+    output = tmp_path / "results"
+    output.mkdir()
+    argv = ["decisionhub", "run-all", str(package_dir), "--instances", str(package_dir / "instance.json")]
+    monkeypatch.setattr(sys, "argv", [*argv, "--output", str(output), "--output-format", "ndjson"])
+
+    assert cli.main() == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert f"not a directory: {output}" in captured.err
+
+
+def test_stream_diagnostics_stay_off_stdout(package_dir, monkeypatch, capsys) -> None:
+    argv = ["decisionhub", "run-all", str(package_dir), "--instances", "-", "--output", "-"]
+    monkeypatch.setattr(sys, "argv", [*argv, "--output-format", "ndjson", "--incremental"])
+
+    assert cli.main() == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "--incremental requires" in captured.err
+
+
+def test_via_daemon_connection_error_stays_off_stdout(package_dir, tmp_path, monkeypatch, capsys) -> None:
+    argv = ["decisionhub", "run", str(package_dir), "--instance", str(package_dir / "instance.json")]
+    socket_path = tmp_path / "missing.sock"
+    monkeypatch.setattr(sys, "argv", [*argv, "--via-daemon", "--socket", str(socket_path)])
+
+    assert cli.main() == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err
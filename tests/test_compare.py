@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from conftest import write_instances
+from rastion import cli
+from rastion.decision_model_package.compare import Thresholds, compare_results
+
+
+def run_all(monkeypatch, package_dir: Path, instances: Path, output: Path, *options: str) -> None:
+    argv = ["decisionhub", "run-all", str(package_dir), "--instances", str(instances)]
+    monkeypatch.setattr(sys, "argv", [*argv, "--output", str(output), "--jobs", "1", *options])
+    assert cli.main() == 0
+
+
+def test_incremental_results_compare_cleanly_with_plain_results(
+    package_dir: Path, tmp_path: Path, monkeypatch
+) -> None:
+    instances = tmp_path / "instances"
+    write_instances(instances, [1, 2, 3])
+    plain, incremental = tmp_path / "plain", tmp_path / "incremental"
+    run_all(monkeypatch, package_dir, instances, plain)
+    run_all(monkeypatch, package_dir, instances, incremental, "--incremental")
+    assert any(path.name.startswith(".") for path in incremental.iterdir())
+
+    thresholds = Thresholds(max_slowdown=None)
+    for base, new in ((plain, incremental), (incremental, plain)):
+        summary = compare_results(base, new, thresholds)
+        assert summary["instances"] == {"compared": 3, "added": 0, "missing": 0, "regressed": 0}
+        assert not summary["regressed"]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import http.client
+import json
+import multiprocessing
+import pickle
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+from conftest import CRASH_VALUE, SLOW_VALUE
+from rastion.decision_model_package.http_service import ExecutionServer, SolvePool
+
+
+@pytest.fixture
+def pool():
+    pool = SolvePool(workers=2, max_queue=4)
+    yield pool
+    pool.shutdown()
+
+
+def wait_for_idle(pool: SolvePool) -> None:
+    deadline = time.monotonic() + 10
+    while pool.inflight and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_worker_crash_is_blamed_on_the_crashing_instance_only(package_dir: Path, pool: SolvePool) -> None:
+    crashing = pool.try_submit(package_dir, [{"value": CRASH_VALUE}])
+    healthy = pool.try_submit(package_dir, [{"value": 1}, {"value": 2}, {"value": 3}])
+
+    crashed = crashing[0].result(timeout=30)
+    assert crashed["metadata"]["error_type"] == "DMP_WORKER_CRASHED"
+    assert [future.result(timeout=30)["status"] for future in healthy] == ["feasible"] * 3
+
+    # The shared pool was replaced and keeps serving.
+    assert pool.try_submit(package_dir, [{"value": 4}])[0].result(timeout=30)["status"] == "feasible"
+    wait_for_idle(pool)
+    assert pool.inflight == 0
+
+
+def test_failed_submit_releases_reserved_slots(package_dir: Path, pool: SolvePool, monkeypatch) -> None:
+    submit = pool._submit
+    calls = []
+
+    def flaky_submit(package_dir: Path, instance: dict):
+        calls.append(instance)
+        if len(calls) == 2:
+            raise RuntimeError("cannot schedule new futures")
+        return submit(package_dir, instance)
+
+    monkeypatch.setattr(pool, "_submit", flaky_submit)
+    with pytest.raises(RuntimeError):
+        pool.try_submit(package_dir, [{"value": 1}, {"value": 2}, {"value": 3}])
+
+    wait_for_idle(pool)
+    assert pool.inflight == 0
+
+
+def test_crash_retries_keep_the_process_count_bounded(package_dir: Path, pool: SolvePool) -> None:
+    crashing = pool.try_submit(package_dir, [{"value": CRASH_VALUE}])
+    healthy = pool.try_submit(package_dir, [{"value": SLOW_VALUE + index} for index in range(5)])
+
+    most_processes = 0
+    while not all(future.done() for future in [*healthy, *crashing]):
+        most_processes = max(most_processes, len(multiprocessing.active_children()))
+        time.sleep(0.01)
+
+    assert crashing[0].result()["metadata"]["error_type"] == "DMP_WORKER_CRASHED"
+    assert [future.result()["status"] for future in healthy] == ["feasible"] * 5
+    # The shared pool plus the single process running a retry.
+    assert most_processes <= pool.workers + 1
+
+
+@pytest.fixture
+def server(package_dir: Path, pool: SolvePool):
+    server = ExecutionServer(("127.0.0.1", 0), {"minimal": package_dir}, pool, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def post(server: ExecutionServer, body: bytes | None, content_length: str | None) -> tuple[int, dict]:
+    connection = http.client.HTTPConnection(*server.server_address, timeout=30)
+    try:
+        connection.putrequest("POST", "/packages/minimal/run")
+        if content_length is not None:
+            connection.putheader("Content-Length", content_length)
+        connection.endheaders(body)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_run_over_http(server: ExecutionServer) -> None:
+    status, result = post(server, b'{"value": 3}', "12")
+    assert status == 200
+    assert result["status"] == "feasible"
+
+
+@pytest.mark.parametrize(
+    ("content_length", "expected"), [(None, 411), ("-1", 400), ("twelve", 400)]
+)
+def test_unusable_content_length_is_rejected(server: ExecutionServer, content_length, expected) -> None:
+    status, payload = post(server, None, content_length)
+    assert status == expected
+    assert "Content-Length" in payload["error"]
+
+
+def test_submit_failure_is_reported_as_server_error(server: ExecutionServer, monkeypatch) -> None:
+    def failing_submit(package_dir: Path, instances: list):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    monkeypatch.setattr(server.pool, "try_submit", failing_submit)
+    status, payload = post(server, b'{"value": 3}', "12")
+    assert status == 500
+    assert "cannot schedule new futures" in payload["error"]
+
+
+def test_failed_instance_is_reported_as_server_error(server: ExecutionServer, monkeypatch) -> None:
+    def failing_submit(package_dir: Path, instances: list):
+        future: Future = Future()
+        future.set_exception(pickle.PicklingError("cannot pickle instance"))
+        return [future]
+
+    monkeypatch.setattr(server.pool, "try_submit", failing_submit)
+    status, payload = post(server, b'{"value": 3}', "12")
+    assert status == 500
+    assert "cannot pickle instance" in payload["error"]
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from conftest import REPO_ROOT
+
+
+@pytest.mark.parametrize("jobs", ["0", "-3"])
+def test_non_positive_jobs_is_a_usage_error(jobs: str) -> None:
+    completed = subprocess.run(
+        [sys.executable, str(REPO_ROOT / "validate_dmp.py"), "templates/minimal-dmp", f"--jobs={jobs}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert completed.returncode == 2
+    assert "--jobs: must be a positive integer" in completed.stderr
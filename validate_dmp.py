@@ -6,249 +6,209 @@ It does not execute the model, solver, or evaluation logic.
 
 Usage:
   python validate_dmp.py /path/to/dmp
+
+Many packages at once (one JSON line per package, in parallel, skipping
+packages whose files have not changed since they were last validated):
+  python validate_dmp.py --recursive --cache /path/to/registry
+  python validate_dmp.py dmp-a/ dmp-b/ dmp-c/ --jobs 8
 """
 
 from __future__ import annotations
 
 import argparse
-import ast
+import hashlib
 import json
-import re
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
 from pathlib import Path
 
-import jsonschema
-import yaml
+try:
+    from rastion.cli import positive_int
+    from rastion.decision_model_package import validation
+except ImportError:  # running from a source checkout without installing
+    sys.path.insert(0, str(Path(__file__).resolve().parent / "core"))
+    from rastion.cli import positive_int
+    from rastion.decision_model_package import validation
 
-REQUIRED_FILES = [
-    "model.py",
-    "instance_schema.json",
-    "solver.yaml",
-    "evaluate.py",
-    "decision_card.md",
-]
+REQUIRED_FILES = validation.REQUIRED_FILES
 
-SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.-]+)?$")
 
-SUPPORTED_SCHEMA_DIALECTS = {
-    "draft-07": jsonschema.Draft7Validator,
-    "2020-12": jsonschema.Draft202012Validator,
-}
+# Packages handed to each worker process at a time.
+CHUNK_SIZE = 8
+CACHE_VERSION = 2
+# Least recently validated packages are dropped from the cache beyond this.
+MAX_CACHE_ENTRIES = 10_000
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Validate a DMP v0.1 package.")
-    parser.add_argument("package_root", help="Path to the DMP package root")
+    parser.add_argument("package_roots", nargs="+", help="Path to the DMP package root(s)")
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Validate every directory below the given paths that holds a decision_card.md",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="Worker processes for multi-package validation (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Skip packages whose files are unchanged since their last validation",
+    )
+    parser.add_argument(
+        "--cache-file",
+        help="Validation cache file (default: ~/.cache/rastion/validation.json)",
+    )
     return parser.parse_args()
 
 
-def list_top_level_functions(path: Path) -> set[str]:
-    try:
-        source = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        raise RuntimeError(f"Failed to read {path.name}: {exc}") from exc
-
-    try:
-        tree = ast.parse(source, filename=str(path))
-    except SyntaxError as exc:
-        raise RuntimeError(f"Syntax error in {path.name}: {exc.msg} (line {exc.lineno})") from exc
+def validate_package(package_root: Path) -> list[dict]:
+    """Validation errors of one package as ``{"code", "message", "file"}`` dicts."""
+    return [error.as_dict() for error in validation.validate(package_root).errors]
 
-    return {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
-
-
-def validate_required_files(package_root: Path, errors: list[str]) -> None:
-    for filename in REQUIRED_FILES:
-        path = package_root / filename
-        if not path.exists():
-            errors.append(f"Missing required file: {filename}")
 
-
-def detect_schema_dialect(schema_uri: str) -> str | None:
-    for key in SUPPORTED_SCHEMA_DIALECTS:
-        if key in schema_uri:
-            return key
-    return None
-
-
-def validate_instance_schema(package_root: Path, errors: list[str]) -> None:
-    schema_path = package_root / "instance_schema.json"
-    if not schema_path.exists():
-        return
-
-    try:
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        errors.append(f"instance_schema.json is not valid JSON: {exc.msg} (line {exc.lineno})")
-        return
-    except OSError as exc:
-        errors.append(f"Failed to read instance_schema.json: {exc}")
-        return
-
-    if not isinstance(schema, dict):
-        errors.append("instance_schema.json must be a JSON object")
-        return
-
-    schema_uri = schema.get("$schema")
-    if not isinstance(schema_uri, str):
-        errors.append("instance_schema.json must declare a $schema string")
-        return
-
-    dialect_key = detect_schema_dialect(schema_uri)
-    if not dialect_key:
-        errors.append(
-            "instance_schema.json declares an unsupported $schema; supported: draft-07, draft 2020-12"
+def discover_packages(root: Path) -> list[Path]:
+    """Directories holding a decision_card.md, without descending into packages."""
+    if (root / "decision_card.md").is_file():
+        return [root]
+    packages: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if "decision_card.md" in filenames:
+            packages.append(Path(dirpath))
+            dirnames.clear()
+            continue
+        dirnames[:] = sorted(
+            name for name in dirnames if not name.startswith(".") and name != "__pycache__"
         )
-        return
+    return packages
 
-    validator_cls = SUPPORTED_SCHEMA_DIALECTS[dialect_key]
-    try:
-        validator_cls.check_schema(schema)
-    except jsonschema.exceptions.SchemaError as exc:
-        errors.append(f"instance_schema.json is not valid JSON Schema: {exc.message}")
-
-
-def validate_model_functions(package_root: Path, errors: list[str]) -> None:
-    model_path = package_root / "model.py"
-    if not model_path.exists():
-        return
-
-    try:
-        functions = list_top_level_functions(model_path)
-    except RuntimeError as exc:
-        errors.append(str(exc))
-        return
-
-    for required in ("create_model", "solve"):
-        if required not in functions:
-            errors.append(f"model.py must define top-level function: {required}()")
-
-
-def validate_evaluate_functions(package_root: Path, errors: list[str]) -> None:
-    evaluate_path = package_root / "evaluate.py"
-    if not evaluate_path.exists():
-        return
 
+def validator_fingerprint() -> str:
+    """Changes whenever this script, the validation engine, its schemas or jsonschema change."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(Path(validation.__file__).read_bytes())
+    for spec in (validation.INSTANCE_SCHEMA_SPEC, validation.SOLVER_SCHEMA_SPEC):
+        digest.update(spec.read_bytes())
     try:
-        functions = list_top_level_functions(evaluate_path)
-    except RuntimeError as exc:
-        errors.append(str(exc))
-        return
+        digest.update(metadata.version("jsonschema").encode("utf-8"))
+    except metadata.PackageNotFoundError:
+        pass
+    return digest.hexdigest()
 
-    for required in ("evaluate", "check_feasibility"):
-        if required not in functions:
-            errors.append(f"evaluate.py must define top-level function: {required}()")
 
+def package_fingerprint(package_root: Path) -> str:
+    digest = hashlib.sha256()
+    for filename in REQUIRED_FILES:
+        digest.update(filename.encode("utf-8") + b"\0")
+        try:
+            digest.update(hashlib.sha256((package_root / filename).read_bytes()).digest())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
 
-def parse_front_matter(content: str) -> tuple[dict | None, str | None]:
-    lines = content.splitlines()
-    if not lines or lines[0].strip() != "---":
-        return None, "decision_card.md must start with YAML front matter (---)"
 
-    end_index = None
-    for index, line in enumerate(lines[1:], start=1):
-        if line.strip() in {"---", "..."}:
-            end_index = index
-            break
+def default_cache_file() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "rastion" / "validation.json"
 
-    if end_index is None:
-        return None, "decision_card.md front matter is not terminated with ---"
 
-    front_matter = "\n".join(lines[1:end_index])
+def load_cache(path: Path, validator_key: str) -> dict[str, list[dict]]:
     try:
-        data = yaml.safe_load(front_matter)
-    except yaml.YAMLError as exc:
-        return None, f"decision_card.md front matter is invalid YAML: {exc}"
-
-    return data, None
-
-
-def validate_decision_card(package_root: Path, errors: list[str]) -> None:
-    card_path = package_root / "decision_card.md"
-    if not card_path.exists():
-        return
-
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != CACHE_VERSION
+        or data.get("validator") != validator_key
+        or not isinstance(data.get("packages"), dict)
+    ):
+        return {}
+    return data["packages"]
+
+
+def save_cache(path: Path, validator_key: str, entries: dict[str, list[dict]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": CACHE_VERSION, "validator": validator_key, "packages": entries}
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".validation-", suffix=".tmp")
     try:
-        content = card_path.read_text(encoding="utf-8")
-    except OSError as exc:
-        errors.append(f"Failed to read decision_card.md: {exc}")
-        return
-
-    data, error = parse_front_matter(content)
-    if error:
-        errors.append(error)
-        return
-
-    if not isinstance(data, dict):
-        errors.append("decision_card.md front matter must be a YAML mapping")
-        return
-
-    required_fields = [
-        "name",
-        "version",
-        "decision_model_package_version",
-        "problem_class",
-        "license",
-        "authors",
-        "tags",
+        with os.fdopen(fd, "w", encoding="utf-8") as stream:
+            json.dump(payload, stream, sort_keys=True)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def validate_many(package_roots: list[Path], jobs: int, cache_file: Path | None) -> int:
+    """Validate packages in parallel and print one JSON line per package."""
+    validator_key = validator_fingerprint()
+    cache = load_cache(cache_file, validator_key) if cache_file is not None else {}
+    fingerprints = [package_fingerprint(root) for root in package_roots]
+    pending = [
+        root for root, fingerprint in zip(package_roots, fingerprints) if fingerprint not in cache
     ]
 
-    for field in required_fields:
-        if field not in data:
-            errors.append(f"decision_card.md front matter missing required field: {field}")
-
-    dmp_version = data.get("decision_model_package_version")
-    if dmp_version is not None and dmp_version != "0.1":
-        errors.append("decision_model_package_version must be '0.1'")
-
-    version = data.get("version")
-    if version is not None:
-        if not isinstance(version, str) or not SEMVER_PATTERN.match(version):
-            errors.append(
-                "version must be a SemVer-like string (e.g. 1.2.3 or 1.2.3-alpha)"
-            )
-
-    authors = data.get("authors")
-    if authors is not None:
-        if not isinstance(authors, list) or not authors:
-            errors.append("authors must be a non-empty list")
-        else:
-            for index, author in enumerate(authors, start=1):
-                if not isinstance(author, dict):
-                    errors.append(f"authors[{index}] must be a mapping")
-                    continue
-                name = author.get("name")
-                if not isinstance(name, str) or not name.strip():
-                    errors.append(f"authors[{index}].name must be a non-empty string")
-
-    tags = data.get("tags")
-    if tags is not None:
-        if not isinstance(tags, list) or not tags:
-            errors.append("tags must be a non-empty list of strings")
-        else:
-            for index, tag in enumerate(tags, start=1):
-                if not isinstance(tag, str) or not tag.strip():
-                    errors.append(f"tags[{index}] must be a non-empty string")
-
-
-def validate_package(package_root: Path) -> list[str]:
-    errors: list[str] = []
-    if not package_root.exists():
-        return [f"Package root does not exist: {package_root}"]
-    if not package_root.is_dir():
-        return [f"Package root is not a directory: {package_root}"]
-
-    validate_required_files(package_root, errors)
-    validate_instance_schema(package_root, errors)
-    validate_model_functions(package_root, errors)
-    validate_evaluate_functions(package_root, errors)
-    validate_decision_card(package_root, errors)
-
-    return errors
+    fresh: dict[Path, list[dict]] = {}
+    if jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+            results = executor.map(validate_package, pending, chunksize=CHUNK_SIZE)
+            for root, errors in zip(pending, results):
+                fresh[root] = errors
+    else:
+        for root in pending:
+            fresh[root] = validate_package(root)
+
+    failed = 0
+    for root, fingerprint in zip(package_roots, fingerprints):
+        cached = root not in fresh
+        errors = cache.pop(fingerprint) if cached else fresh[root]
+        # Re-inserting keeps the cache ordered from least to most recently seen.
+        cache[fingerprint] = errors
+        failed += bool(errors)
+        record = {
+            "package": str(root),
+            "ok": not errors,
+            "errors": [error["message"] for error in errors],
+            "issues": errors,
+            "cached": cached,
+            "fingerprint": fingerprint,
+        }
+        print(json.dumps(record, sort_keys=True))
+
+    if cache_file is not None:
+        keep = list(cache.items())[-MAX_CACHE_ENTRIES:]
+        save_cache(cache_file, validator_key, dict(keep))
+    return 1 if failed else 0
 
 
 def main() -> int:
     args = parse_args()
-    package_root = Path(args.package_root).resolve()
-    errors = validate_package(package_root)
+    roots = [Path(path).resolve() for path in args.package_roots]
+    if args.recursive or len(roots) > 1 or args.cache or args.jobs is not None:
+        package_roots: list[Path] = []
+        for root in roots:
+            if not root.is_dir():
+                print(f"Package root is not a directory: {root}", file=sys.stderr)
+                return 1
+            package_roots.extend(discover_packages(root) if args.recursive else [root])
+        if not package_roots:
+            print("No packages found", file=sys.stderr)
+            return 1
+        cache_file = None
+        if args.cache:
+            cache_file = Path(args.cache_file) if args.cache_file else default_cache_file()
+        return validate_many(package_roots, args.jobs or os.cpu_count() or 1, cache_file)
+
+    package_root = roots[0]
+    errors = validation.validate(package_root).messages
 
     if errors:
         print("DMP validation failed with the following issues:")